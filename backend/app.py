@@ -5,13 +5,20 @@
 
 #----------------------------------------------------------------------------------------------------------------------------
 # IMPORTS
-from fastapi import FastAPI, HTTPException, Path as ApiPath, Depends
+from fastapi import FastAPI, HTTPException, Path as ApiPath, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 from pathlib import Path
-import json
-from typing import Dict, Any, List
-from dataclasses import asdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import os
+import hashlib
+import logging
+from types import MappingProxyType
+from typing import Annotated, Callable, Dict, Any, List, Optional, Tuple, FrozenSet
 from models.registry import get_model, get_formatter, get_available_farm_types
 #----------------------------------------------------------------------------------------------------------------------------
 
@@ -22,6 +29,65 @@ from models.registry import get_model, get_formatter, get_available_farm_types
 BASE_DIR = Path(__file__).resolve().parent
 # Farm assets directory
 FARMS_SCEN_DIR = (BASE_DIR / "../assets/farms").resolve()
+# Same directory as plain string prefix, so per-request paths are built without Path objects
+FARMS_SCEN_DIR_STR = str(FARMS_SCEN_DIR) + os.sep
+# Preloaded scenarios: farm_type -> scenario_id -> scenario data (filled at startup)
+SCENARIOS: Dict[str, Dict[int, Dict[str, Any]]] = {}
+# Preloaded scenario listings: farm_type -> scenario metadata list, sorted by ID
+SCENARIO_LISTS: Dict[str, List[Dict[str, Any]]] = {}
+# Pre-serialized scenario GET response bodies: (farm_type, scenario_id) -> JSON bytes
+SCENARIO_RESPONSES: Dict[Tuple[str, int], bytes] = {}
+# Strong ETags of the pre-serialized bodies: (farm_type, scenario_id) -> quoted sha1 hex
+SCENARIO_ETAGS: Dict[Tuple[str, int], str] = {}
+# Scenario URLs are not content-addressed and files may change between deploys,
+# so clients may store responses but must revalidate (answered with a cheap 304)
+SCENARIO_CACHE_CONTROL = "public, no-cache"
+# Scenario file name pattern: scenario_<id>.json
+SCEN_PREFIX = "scenario_"
+SCEN_SUFFIX = ".json"
+# Max concurrent file reads when preloading scenarios
+SCEN_IO_WORKERS = 8
+# Unreadable scenario files are logged and skipped at preload instead of failing startup
+logger = logging.getLogger(__name__)
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Supported farm types - Resolved once from the registry at import time
+# FARM_TYPES keeps the sorted order for responses, SUPPORTED_FARMS gives O(1) membership checks
+# DISPATCH maps each farm type to its (model instance, formatter) pair for the request path
+#----------------------------------------------------------------------------------------------------------------------------
+FARM_TYPES: Tuple[str, ...] = tuple(get_available_farm_types())
+SUPPORTED_FARMS: FrozenSet[str] = frozenset(FARM_TYPES)
+DISPATCH: Dict[str, Tuple[Any, Callable[[Dict[str, Any], str], Dict[str, Any]]]] = {
+    ft: (get_model(ft), get_formatter(ft)) for ft in FARM_TYPES
+}
+# Error message template, only formatted on the failure branch
+UNSUPPORTED_FARM_MSG = "Unsupported farm_type='{ft}'. Supported: " + repr(list(FARM_TYPES))
+# Pre-serialized GET /v1/farm-types body
+FARM_TYPES_BODY: bytes = orjson.dumps({"farm_types": FARM_TYPES})
+FARM_TYPES_CACHE_CONTROL = "public, max-age=3600"
+
+def refresh_farm_types() -> None:
+    """
+    Re-read supported farm types from the registry (e.g. after registering a model in tests).
+
+    Rebuilds the module globals derived from the registry:
+        FARM_TYPES: Sorted farm type tuple used in responses
+        SUPPORTED_FARMS: Frozenset for O(1) membership checks
+        DISPATCH: farm_type -> (model instance, formatter)
+        UNSUPPORTED_FARM_MSG: Error message template listing the supported types
+        FARM_TYPES_BODY: Pre-serialized GET /v1/farm-types body
+
+    Memoized recommendation bodies are dropped as well (invalidate_model_cache).
+    Scenarios of newly added farm types are only loaded by a following preload_scenarios().
+    """
+    global FARM_TYPES, SUPPORTED_FARMS, DISPATCH, UNSUPPORTED_FARM_MSG, FARM_TYPES_BODY
+    FARM_TYPES = tuple(get_available_farm_types())
+    SUPPORTED_FARMS = frozenset(FARM_TYPES)
+    DISPATCH = {ft: (get_model(ft), get_formatter(ft)) for ft in FARM_TYPES}
+    UNSUPPORTED_FARM_MSG = "Unsupported farm_type='{ft}'. Supported: " + repr(list(FARM_TYPES))
+    FARM_TYPES_BODY = orjson.dumps({"farm_types": FARM_TYPES})
+    invalidate_model_cache()
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -29,25 +95,65 @@ FARMS_SCEN_DIR = (BASE_DIR / "../assets/farms").resolve()
 #----------------------------------------------------------------------------------------------------------------------------
 class RecommendRequest(BaseModel):
     """Request model for recommendations endpoint"""
-    farm_type: str
+    # Strip/lowercase runs inside pydantic-core, the validator only checks membership
+    farm_type: Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
     scenario_id: int = Field(..., ge=1, le=1000)
     language: str = Field("az", min_length=2, max_length=5)
     @field_validator('farm_type')
     def validate_farm_type(cls, v):
-        ft = v.strip().lower()
-        supported_farms = get_available_farm_types()
-        if ft not in supported_farms:
-            raise ValueError(f"Unsupported farm_type='{ft}'. Supported: {supported_farms}")
-        return ft
+        return check_farm_type(v)
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Batch request - 1 to 1000 RecommendRequest items answered in one call
+#----------------------------------------------------------------------------------------------------------------------------
+class BatchRecommendRequest(BaseModel):
+    """
+    Request model for batch recommendations endpoint.
+
+    Args:
+        items: 1-1000 recommendation requests, each validated like RecommendRequest
+               (an empty list or more than 1000 items is rejected with 422)
+
+    Note:
+        Items are answered in request order and the batch is all-or-nothing:
+        the first failing item (e.g. 404 for an unknown scenario) fails the whole batch
+    """
+    items: List[RecommendRequest] = Field(..., min_length=1, max_length=1000)
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
 # Initialize FastAPI Application
 #----------------------------------------------------------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown hook.
+
+    On startup preload_scenarios() reads every scenario file of the supported farm types and fills:
+        SCENARIOS: farm_type -> scenario_id -> scenario data, frozen read-only
+                   (MappingProxyType dicts, tuple lists) since it is shared across requests
+        SCENARIO_LISTS: farm_type -> scenario metadata list for the UI, sorted by ID
+        SCENARIO_RESPONSES: (farm_type, scenario_id) -> pre-serialized GET scenario body
+        SCENARIO_ETAGS: (farm_type, scenario_id) -> strong ETag of that body
+    Broken scenario files are logged and skipped, so they never abort startup.
+
+    Args:
+        app: FastAPI application (unused)
+
+    Returns:
+        Async context manager; nothing is torn down on shutdown
+    """
+    # Load all scenario files once, requests only do dictionary lookups
+    preload_scenarios()
+    yield
+
 app = FastAPI(
     title="Digirella - Farm Assistant API",
     description="AI-powered agricultural decision support system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware for cross-origin requests
@@ -67,17 +173,39 @@ app.add_middleware(
 #----------------------------------------------------------------------------------------------------------------------------
 # Extract scenario ID from filename
 #----------------------------------------------------------------------------------------------------------------------------
-def extract_scenario_id(path: Path) -> int:
+def extract_scenario_id(name: str) -> int:
     """
     Extract scenario ID from filename like 'scenario_10.json'.
 
     Args:
-        path: Path to scenario file
+        name: Scenario file name (must start with SCEN_PREFIX and end with SCEN_SUFFIX)
 
     Returns:
         Scenario ID as integer
     """
-    return int(path.stem.split("_")[1])
+    return int(name[len(SCEN_PREFIX):-len(SCEN_SUFFIX)])
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Check that a normalized farm type is supported
+# Shared by the RecommendRequest validator and the validate_farm_type dependency
+#----------------------------------------------------------------------------------------------------------------------------
+def check_farm_type(ft: str) -> str:
+    """
+    Check an already normalized farm type against SUPPORTED_FARMS.
+
+    Args:
+        ft: Farm type (lowercase, stripped)
+
+    Returns:
+        The same farm type
+
+    Raises:
+        ValueError: If farm type is not supported (Pydantic turns this into a 422)
+    """
+    if ft not in SUPPORTED_FARMS:
+        raise ValueError(UNSUPPORTED_FARM_MSG.format(ft=ft))
+    return ft
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -97,21 +225,32 @@ def validate_farm_type(farm_type: str) -> str:
     Raises:
         HTTPException: If farm type is not supported
     """
-    ft = farm_type.strip().lower()
-    supported_farms = get_available_farm_types()
+    try:
+        return check_farm_type(farm_type.strip().lower())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+#----------------------------------------------------------------------------------------------------------------------------
 
-    if ft not in supported_farms:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported farm_type='{ft}'. Supported: {supported_farms}"
-        )
-    return ft
+#----------------------------------------------------------------------------------------------------------------------------
+# Get scenario directory for a specific farm type
+#----------------------------------------------------------------------------------------------------------------------------
+def scenario_dir(farm_type: str) -> str:
+    """
+    Build path to the scenario directory of a farm type.
+
+    Args:
+        farm_type: Type of farm (already normalized)
+
+    Returns:
+        Directory path as string
+    """
+    return f"{FARMS_SCEN_DIR_STR}{farm_type}{os.sep}synthetic_scenarios"
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
 # Get scenario file path for a specific farm type and scenario ID
 #----------------------------------------------------------------------------------------------------------------------------
-def scenario_path(farm_type: str, scenario_id: int) -> Path:
+def scenario_path(farm_type: str, scenario_id: int) -> str:
     """
     Build path to scenario JSON file.
 
@@ -120,35 +259,156 @@ def scenario_path(farm_type: str, scenario_id: int) -> Path:
         scenario_id: Scenario number
 
     Returns:
-        Path to scenario file
+        Path to scenario file as string
     """
-    return FARMS_SCEN_DIR / farm_type / "synthetic_scenarios" / f"scenario_{scenario_id}.json"
+    return f"{scenario_dir(farm_type)}{os.sep}{SCEN_PREFIX}{scenario_id}{SCEN_SUFFIX}"
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
-# Load JSON file with error handling
+# Load a scenario JSON file, skipping unreadable ones
+# Runs at preload (outside any request), so problems are logged instead of raised as HTTPException
 #----------------------------------------------------------------------------------------------------------------------------
-def load_json(path: Path) -> Dict[str, Any]:
+def read_scenario_file(path: str) -> Optional[Dict[str, Any]]:
     """
-    Load and parse JSON file.
+    Load and parse a scenario JSON file.
 
     Args:
         path: Path to JSON file
 
     Returns:
-        Parsed JSON data
+        Parsed scenario data, or None if the file cannot be read, is not valid JSON,
+        or does not hold a JSON object (logged as a warning)
+    """
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Skipping scenario file %s: %s", path, e)
+        return None
+    if not isinstance(data, dict):
+        logger.warning("Skipping scenario file %s: top-level JSON value is not an object", path)
+        return None
+    return data
+#----------------------------------------------------------------------------------------------------------------------------
 
-    Raises:
-        HTTPException: If file not found or invalid JSON
+#----------------------------------------------------------------------------------------------------------------------------
+# Recursively freeze parsed JSON so it can be shared safely across requests
+#----------------------------------------------------------------------------------------------------------------------------
+def freeze_json(value: Any) -> Any:
+    """
+    Convert parsed JSON into a read-only structure.
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        Same data with dicts wrapped in MappingProxyType and lists turned into tuples
+        (callers that need to mutate must copy explicitly)
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze_json(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_json(v) for v in value)
+    return value
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Load all scenario files of a farm type from disk
+#----------------------------------------------------------------------------------------------------------------------------
+def load_farm_scenarios(farm_type: str) -> Dict[int, Dict[str, Any]]:
     """
-    if not path.exists():
-        raise HTTPException(status_code=404, detail=f"File not found: {path}")
+    Read and parse every scenario file of a farm type.
 
+    Args:
+        farm_type: Type of farm (already normalized)
+
+    Returns:
+        Parsed scenario data by scenario ID, in ascending ID order
+        (files with a non-integer ID or unreadable content are logged and skipped)
+    """
+    scen_dir = scenario_dir(farm_type)
+
+    # Find all scenario files in one directory pass and sort by ID (no Path objects needed)
+    files: List[Tuple[int, str]] = []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=500, detail=f"Invalid JSON in {path}: {e}")
+        with os.scandir(scen_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(SCEN_PREFIX) and name.endswith(SCEN_SUFFIX)):
+                    continue
+                try:
+                    files.append((extract_scenario_id(name), entry.path))
+                except ValueError:
+                    logger.warning("Skipping scenario file %s: ID is not an integer", entry.path)
+    except FileNotFoundError:
+        return {}
+    files.sort()
+
+    # File reads overlap in a small thread pool, unreadable files are dropped
+    with ThreadPoolExecutor(max_workers=SCEN_IO_WORKERS) as pool:
+        datas = pool.map(read_scenario_file, [file_path for _, file_path in files])
+        return {file_id: data for (file_id, _), data in zip(files, datas) if data is not None}
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Preload all scenarios into memory
+# Called once at application startup, scenario files are immutable deployment assets
+#----------------------------------------------------------------------------------------------------------------------------
+def preload_scenarios() -> None:
+    """
+    Load scenarios of all supported farm types into SCENARIOS, SCENARIO_LISTS,
+    SCENARIO_RESPONSES and SCENARIO_ETAGS.
+    Can be called again to pick up changed files.
+    """
+    raw = {ft: load_farm_scenarios(ft) for ft in FARM_TYPES}
+
+    # Pre-serialize GET /v1/farms/{farm_type}/scenarios/{scenario_id} bodies from the plain parsed data
+    responses = {
+        (ft, scen_id): orjson.dumps({"farm_type": ft, "scenario_id": scen_id, "scenario_data": data})
+        for ft, by_id in raw.items()
+        for scen_id, data in by_id.items()
+    }
+
+    etags = {key: f'"{hashlib.sha1(body).hexdigest()}"' for key, body in responses.items()}
+
+    scenarios = {
+        ft: {scen_id: freeze_json(data) for scen_id, data in by_id.items()}
+        for ft, by_id in raw.items()
+    }
+    lists = {
+        ft: [
+            # Extract minimal metadata for UI
+            {
+                "id": scen_id,
+                "scenario_id": data.get("scenario_id", ""),
+                "summary_az": data.get("summary_az", "")
+            }
+            for scen_id, data in by_id.items()
+        ]
+        for ft, by_id in scenarios.items()
+    }
+
+    # Swap in complete tables so concurrent requests never see a half-built state
+    global SCENARIOS, SCENARIO_LISTS, SCENARIO_RESPONSES, SCENARIO_ETAGS
+    SCENARIOS, SCENARIO_LISTS, SCENARIO_RESPONSES, SCENARIO_ETAGS = scenarios, lists, responses, etags
+    invalidate_model_cache()
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Build 404 error for a missing scenario
+#----------------------------------------------------------------------------------------------------------------------------
+def scenario_not_found(farm_type: str, scenario_id: int) -> HTTPException:
+    """
+    Create the HTTP 404 error raised for unknown scenarios.
+
+    Args:
+        farm_type: Type of farm (already normalized)
+        scenario_id: Scenario number
+
+    Returns:
+        HTTPException to raise
+    """
+    return HTTPException(status_code=404, detail=f"File not found: {scenario_path(farm_type, scenario_id)}")
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -156,16 +416,22 @@ def load_json(path: Path) -> Dict[str, Any]:
 #----------------------------------------------------------------------------------------------------------------------------
 def load_scenario(farm_type: str, scenario_id: int) -> Dict[str, Any]:
     """
-    Load scenario data for a specific farm type and ID.
+    Get preloaded scenario data for a specific farm type and ID.
 
     Args:
         farm_type: Type of farm (already normalized)
         scenario_id: Scenario number
 
     Returns:
-        Scenario data dictionary
+        Read-only scenario mapping, shared between requests (use copy.deepcopy to modify)
+
+    Raises:
+        HTTPException: If scenario does not exist
     """
-    return load_json(scenario_path(farm_type, scenario_id))
+    try:
+        return SCENARIOS[farm_type][scenario_id]
+    except KeyError:
+        raise scenario_not_found(farm_type, scenario_id)
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -179,27 +445,30 @@ def list_scenarios_for_farm(farm_type: str) -> List[Dict[str, Any]]:
         farm_type: Type of farm (already normalized)
 
     Returns:
-        List of scenario metadata (id, scenario_id, summary_az)
+        List of scenario metadata (id, scenario_id, summary_az) - shared, do not mutate
     """
-    scen_dir = FARMS_SCEN_DIR / farm_type / "synthetic_scenarios"
-
-    if not scen_dir.exists():
-        return []
+    return SCENARIO_LISTS.get(farm_type, [])
+#----------------------------------------------------------------------------------------------------------------------------
 
-    # Find all scenario files and sort by ID
-    files = sorted(scen_dir.glob("scenario_*.json"), key=extract_scenario_id)
+#----------------------------------------------------------------------------------------------------------------------------
+# Check an If-None-Match request header against an ETag
+#----------------------------------------------------------------------------------------------------------------------------
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of If-None-Match header value with an ETag (RFC 9110).
 
-    scenarios = []
-    for file_path in files:
-        data = load_json(file_path)
-        # Extract minimal metadata for UI
-        scenarios.append({
-            "id": extract_scenario_id(file_path),
-            "scenario_id": data.get("scenario_id", ""),
-            "summary_az": data.get("summary_az", "")
-        })
+    Args:
+        if_none_match: Raw header value (may list several tags or be '*')
+        etag: Quoted ETag of the current representation
 
-    return scenarios
+    Returns:
+        True if the client's cached copy is still current
+    """
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -221,27 +490,102 @@ def run_model(farm_type: str, scenario_data: Dict[str, Any], language: str = "az
         HTTPException: If model not found or execution fails
     """
     try:
-        # Get model and run it
-        model = get_model(farm_type)
+        # Run model and localize output (farm_type already validated against SUPPORTED_FARMS)
+        model, formatter = DISPATCH[farm_type]
         model_out = model.run(scenario_data)
-
-        # Get formatter and localize output
-        formatter = get_formatter(farm_type)
-        return formatter(asdict(model_out), language)
+        return formatter(model_out.to_dict(), language)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Model execution failed: {e}")
 #----------------------------------------------------------------------------------------------------------------------------
 
+#----------------------------------------------------------------------------------------------------------------------------
+# Memoized recommendation response bodies
+# Models and formatters are pure functions of the scenario data, so the full JSON body is cached per
+# (farm_type, scenario_id, language). Any model/formatter with side effects or hidden state breaks this
+# Cache keys also carry generation counters: invalidation bumps them after the tables are swapped, so a
+# request still computing from the old tables stores its body under a stale key that is never looked up again
+#----------------------------------------------------------------------------------------------------------------------------
+# Bumped by every full invalidation
+_CACHE_GENERATION = 0
+# Bumped per farm type by invalidate_model_cache(farm_type)
+_FARM_CACHE_GENERATION: Dict[str, int] = {}
+
+@lru_cache(maxsize=8192)
+def _cached_recommendation_body(
+    farm_type: str, scenario_id: int, language: str, generation: int, farm_generation: int
+) -> bytes:
+    """
+    Load scenario, run model and serialize the /v1/recommendations response.
+
+    Args:
+        farm_type: Type of farm (already normalized)
+        scenario_id: Scenario number
+        language: Output language
+        generation: _CACHE_GENERATION at call time (cache key only)
+        farm_generation: _FARM_CACHE_GENERATION of farm_type at call time (cache key only)
+
+    Returns:
+        JSON body with farm_type, scenario_id, and model_output
+
+    Raises:
+        HTTPException: If scenario not found or model execution fails (errors are not cached)
+    """
+    scenario_data = load_scenario(farm_type, scenario_id)
+    model_output = run_model(farm_type, scenario_data, language)
+    return orjson.dumps({
+        "farm_type": farm_type,
+        "scenario_id": scenario_id,
+        "model_output": model_output
+    })
+
+def recommendation_body(farm_type: str, scenario_id: int, language: str) -> bytes:
+    """
+    Memoized /v1/recommendations response body for the current scenario tables.
+
+    Args:
+        farm_type: Type of farm (already normalized)
+        scenario_id: Scenario number
+        language: Output language
+
+    Returns:
+        JSON body with farm_type, scenario_id, and model_output
+
+    Raises:
+        HTTPException: If scenario not found or model execution fails (errors are not cached)
+    """
+    # Generations are read before the scenario tables (see invalidate_model_cache)
+    return _cached_recommendation_body(
+        farm_type, scenario_id, language, _CACHE_GENERATION, _FARM_CACHE_GENERATION.get(farm_type, 0)
+    )
+
+def invalidate_model_cache(farm_type: Optional[str] = None) -> None:
+    """
+    Drop memoized recommendation bodies (e.g. after reloading scenarios or models).
+    Must be called after the new scenario tables / models are in place.
+
+    Args:
+        farm_type: Only invalidate this farm type; all farm types if None
+    """
+    global _CACHE_GENERATION
+    if farm_type is None:
+        _CACHE_GENERATION += 1
+        # Free memory right away, stale-generation entries would otherwise wait for LRU eviction
+        _cached_recommendation_body.cache_clear()
+    else:
+        _FARM_CACHE_GENERATION[farm_type] = _FARM_CACHE_GENERATION.get(farm_type, 0) + 1
+#----------------------------------------------------------------------------------------------------------------------------
+
 #----------------------------------------------------------------------------------------------------------------------------
 # API Endpoints
+# Responses are built from trusted data, so response_model=None skips response validation
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
 # Health check endpoint
 #----------------------------------------------------------------------------------------------------------------------------
-@app.get("/health")
+@app.get("/health", response_model=None)
 def health():
     """
     Health check endpoint.
@@ -255,21 +599,25 @@ def health():
 #----------------------------------------------------------------------------------------------------------------------------
 # Get list of supported farm types
 #----------------------------------------------------------------------------------------------------------------------------
-@app.get("/v1/farm-types")
+@app.get("/v1/farm-types", response_model=None)
 def get_farm_types():
     """
     Get list of all supported farm types.
 
     Returns:
-        Dictionary with farm_types list (auto-detected from registry)
+        JSON body with farm_types list (auto-detected from registry, serialized once)
     """
-    return {"farm_types": get_available_farm_types()}
+    return Response(
+        content=FARM_TYPES_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": FARM_TYPES_CACHE_CONTROL}
+    )
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
 # Get all scenarios for a farm type
 #----------------------------------------------------------------------------------------------------------------------------
-@app.get("/v1/farms/{farm_type}/scenarios")
+@app.get("/v1/farms/{farm_type}/scenarios", response_model=None)
 def get_scenarios(farm_type: str = Depends(validate_farm_type)):
     """
     Get list of scenarios for a specific farm type.
@@ -289,8 +637,9 @@ def get_scenarios(farm_type: str = Depends(validate_farm_type)):
 #----------------------------------------------------------------------------------------------------------------------------
 # Get specific scenario data
 #----------------------------------------------------------------------------------------------------------------------------
-@app.get("/v1/farms/{farm_type}/scenarios/{scenario_id}")
+@app.get("/v1/farms/{farm_type}/scenarios/{scenario_id}", response_model=None)
 def get_scenario(
+    request: Request,
     farm_type: str = Depends(validate_farm_type),
     scenario_id: int = ApiPath(..., ge=1, le=1000)
 ):
@@ -298,24 +647,30 @@ def get_scenario(
     Get raw data for a specific scenario.
 
     Args:
+        request: Incoming request (for If-None-Match)
         farm_type: Farm type (validated by dependency)
         scenario_id: Scenario number (1-1000)
 
     Returns:
-        Dictionary with farm_type, scenario_id, and scenario_data
+        JSON body with farm_type, scenario_id, and scenario_data (pre-serialized at startup),
+        or an empty 304 response if the client's ETag is current
     """
-    data = load_scenario(farm_type, scenario_id)
-    return {
-        "farm_type": farm_type,
-        "scenario_id": scenario_id,
-        "scenario_data": data
-    }
+    key = (farm_type, scenario_id)
+    body = SCENARIO_RESPONSES.get(key)
+    if body is None:
+        raise scenario_not_found(farm_type, scenario_id)
+
+    headers = {"ETag": SCENARIO_ETAGS[key], "Cache-Control": SCENARIO_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
 # Generate recommendations for a scenario
 #----------------------------------------------------------------------------------------------------------------------------
-@app.post("/v1/recommendations")
+@app.post("/v1/recommendations", response_model=None)
 def recommendations(req: RecommendRequest):
     """
     Generate farming recommendations for a specific scenario.
@@ -324,16 +679,29 @@ def recommendations(req: RecommendRequest):
         req: Request with farm_type, scenario_id, and language
 
     Returns:
-        Dictionary with farm_type, scenario_id, and model_output
+        JSON body with farm_type, scenario_id, and model_output (memoized per scenario and language)
     """
+    body = recommendation_body(req.farm_type, req.scenario_id, req.language)
+    return Response(content=body, media_type="application/json")
+#----------------------------------------------------------------------------------------------------------------------------
 
-    # Load scenario and run model
-    scenario_data = load_scenario(req.farm_type, req.scenario_id)
-    model_output = run_model(req.farm_type, scenario_data, req.language)
+#----------------------------------------------------------------------------------------------------------------------------
+# Generate recommendations for many scenarios in one call
+#----------------------------------------------------------------------------------------------------------------------------
+@app.post("/v1/recommendations:batch", response_model=None)
+def recommendations_batch(req: BatchRecommendRequest):
+    """
+    Generate farming recommendations for several scenarios at once.
+    Amortizes routing, validation and response overhead over all items.
 
-    return {
-        "farm_type": req.farm_type,
-        "scenario_id": req.scenario_id,
-        "model_output": model_output
-    }
+    Args:
+        req: Request with items, each having farm_type, scenario_id, and language
+
+    Returns:
+        JSON body with results list, in request order, each shaped like /v1/recommendations output.
+        Fails as a whole with the first item's error (e.g. 404 for an unknown scenario)
+    """
+    # Memoized bodies are already JSON, so they are spliced together without re-encoding
+    bodies = [recommendation_body(item.farm_type, item.scenario_id, item.language) for item in req.items]
+    return Response(content=b'{"results":[' + b",".join(bodies) + b"]}", media_type="application/json")
 #----------------------------------------------------------------------------------------------------------------------------
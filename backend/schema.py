@@ -6,7 +6,8 @@
 #----------------------------------------------------------------------------------------------------------------------------
 # IMPORTS
 from dataclasses import dataclass
-from typing import Any, Dict, List
+import sys
+from typing import Any, Callable, Dict, List, Tuple
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -17,19 +18,34 @@ class ModelOutput:
     derived: Dict[str, Any]                    # Derived buckets (e.g., moisture_bucket, weather_bucket)
     recommendations: List[Dict[str, Any]]      # List of recommended actions with reasons
     not_recommended: List[Dict[str, Any]]      # List of not-recommended actions with reasons
+
+    #----------------------------------------------------------------------------------------------------------------------------
+    # Shallow dict view for formatters
+    # Cheaper than dataclasses.asdict, which deep-copies every nested list and dict
+    #----------------------------------------------------------------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """Return top-level fields as a dict (nested values are shared, not copied)"""
+        return {
+            "derived": self.derived,
+            "recommendations": self.recommendations,
+            "not_recommended": self.not_recommended,
+        }
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
 # Base scenario data wrapper - Generic accessor for all farm types
 # Provides flexible nested dictionary access without hardcoded properties
+# Subclasses read and coerce every typed value once in __post_init__ and store it as a plain attribute
+# Slotted throughout; subclasses list their __post_init__ attributes in __slots__
 #----------------------------------------------------------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class BaseScenarioData:
     decision_inputs: Dict[str, Any]
 
     #----------------------------------------------------------------------------------------------------------------------------
     # Generic nested accessor for any farm type
     # Usage: data.get('weather', 't_max_c') or data.get('livestock', 'feed_kg')
+    # Indexes straight down the path; a missing key or non-mapping intermediate falls back to default
     #----------------------------------------------------------------------------------------------------------------------------
     def get(self, *keys, default: Any = None) -> Any:
         """
@@ -46,306 +62,226 @@ class BaseScenarioData:
             >>> data.get('weather', 't_max_c', default=0)
             >>> data.get('soil', 'moisture_pct', default=20)
         """
-        result = self.decision_inputs
-        for key in keys:
-            if isinstance(result, dict):
-                result = result.get(key)
-                if result is None:
-                    return default
-            else:
-                return default
-        return result if result is not None else default
-#----------------------------------------------------------------------------------------------------------------------------
-
-#----------------------------------------------------------------------------------------------------------------------------
-# Wheat-specific scenario data with typed property accessors
-# Extends BaseScenarioData with wheat-specific convenience properties
-#----------------------------------------------------------------------------------------------------------------------------
-@dataclass
-class WheatScenarioData(BaseScenarioData):
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Weather properties - Temperature, rainfall, wind, humidity
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def tmax(self) -> float:
-        """Maximum temperature in Celsius"""
-        return float(self.get("weather", "t_max_c", default=0))
-
-    @property
-    def rain24(self) -> float:
-        """Rainfall in last 24 hours (mm)"""
-        return float(self.get("weather", "rain_mm_24h", default=0))
-
-    @property
-    def rain48(self) -> float:
-        """Forecasted rainfall in next 48 hours (mm)"""
-        return float(self.get("weather", "forecast_rain_mm_48h", default=0))
-
-    @property
-    def wind(self) -> float:
-        """Wind speed in meters per second"""
-        return float(self.get("weather", "wind_mps", default=0))
-
-    @property
-    def humidity(self) -> float:
-        """Relative humidity percentage"""
-        return float(self.get("weather", "humidity_pct", default=0))
+        try:
+            value = self.decision_inputs
+            for key in keys:
+                value = value[key]
+        except (KeyError, TypeError):
+            return default
+        return default if value is None else value
     #----------------------------------------------------------------------------------------------------------------------------
 
     #----------------------------------------------------------------------------------------------------------------------------
-    # Soil properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def soil_moisture(self) -> float:
-        """Soil moisture percentage"""
-        return float(self.get("soil", "soil_moisture_pct", default=0))
+    # Typed accessors - Skip the coercion call when JSON already produced the right type
+    # Defaults are passed pre-coerced (e.g. 0.0, not 0) and returned as-is
+    # Subclasses read every field up front, so a malformed value anywhere is a ValueError (HTTP 400),
+    # never a TypeError (HTTP 500), whichever field happens to be read first
     #----------------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _coerce(convert: Callable[[Any], Any], value: Any, keys: Tuple[str, ...]) -> Any:
+        """
+        Convert a raw JSON value, reporting unconvertible types as ValueError.
 
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Crop properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def stage(self) -> str:
-        """Current crop growth stage (e.g., 'tillering', 'flowering')"""
-        return str(self.get("crop", "stage_code", default="unknown"))
-    #----------------------------------------------------------------------------------------------------------------------------
+        Args:
+            convert: Target type constructor (float or int)
+            value: Raw value from decision_inputs
+            keys: Key path of the value, used in the error message
 
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Constraint properties - Resource availability
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def water_available(self) -> bool:
-        """Whether water is available for irrigation"""
-        return bool(self.get("constraints", "water_available", default=True))
-
-    @property
-    def irrigation_possible_today(self) -> bool:
-        """Whether irrigation is operationally possible today"""
-        return bool(self.get("constraints", "irrigation_possible_today", default=True))
-    #----------------------------------------------------------------------------------------------------------------------------
+        Returns:
+            Converted value
 
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Observation properties - Pest and disease detection
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def aphids_seen(self) -> bool:
-        """Whether aphids have been observed on the crop"""
-        return bool(self.get("observations", "pest_aphids_seen", default=False))
-
-    @property
-    def rust_seen(self) -> bool:
-        """Whether rust disease has been observed on the crop"""
-        return bool(self.get("observations", "disease_rust_seen", default=False))
-    #----------------------------------------------------------------------------------------------------------------------------
+        Raises:
+            ValueError: If the value cannot be converted
+        """
+        try:
+            return convert(value)
+        except TypeError as e:
+            raise ValueError(f"Invalid value for {'.'.join(keys)}: {e}") from e
+
+    def get_float(self, *keys, default: float) -> float:
+        """Get value at key path as float, or default if not found"""
+        value = self.get(*keys)
+        if value is None:
+            return default
+        return value if type(value) is float else self._coerce(float, value, keys)
+
+    def get_int(self, *keys, default: int) -> int:
+        """Get value at key path as int, or default if not found"""
+        value = self.get(*keys)
+        if value is None:
+            return default
+        return value if type(value) is int else self._coerce(int, value, keys)
+
+    def get_bool(self, *keys, default: bool) -> bool:
+        """Get value at key path as bool, or default if not found"""
+        value = self.get(*keys)
+        if value is None:
+            return default
+        return value if type(value) is bool else bool(value)
+    #----------------------------------------------------------------------------------------------------------------------------
+
+    #----------------------------------------------------------------------------------------------------------------------------
+    # Categorical accessor (stage, health, pest pressure, ...)
+    # Interned so rule comparisons against string literals hit the identity fast path
+    #----------------------------------------------------------------------------------------------------------------------------
+    def get_category(self, *keys, default: str) -> str:
+        """
+        Get a categorical value as an interned string.
+
+        Args:
+            *keys: Path to the value (e.g., 'crop', 'stage_code')
+            default: Category used if key path not found
+
+        Returns:
+            Interned category string
+        """
+        return sys.intern(str(self.get(*keys, default=default)))
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
-# Livestock-specific scenario data with typed property accessors
-# Extends BaseScenarioData with livestock-specific convenience properties
+# Wheat-specific scenario data with typed attributes
+# Extends BaseScenarioData with wheat-specific convenience attributes
 #----------------------------------------------------------------------------------------------------------------------------
 @dataclass
-class LivestockScenarioData(BaseScenarioData):
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Environment properties - Temperature and humidity
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def temperature_c(self) -> float:
-        """Ambient temperature in Celsius"""
-        return float(self.get("environment", "temperature_c", default=20))
-
-    @property
-    def humidity_pct(self) -> float:
-        """Relative humidity percentage"""
-        return float(self.get("environment", "humidity_pct", default=60))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Resource properties - Feed and water availability
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def feed_kg(self) -> float:
-        """Available feed in kilograms"""
-        return float(self.get("resources", "feed_kg", default=0))
-
-    @property
-    def water_liters(self) -> float:
-        """Available water in liters"""
-        return float(self.get("resources", "water_liters", default=0))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Production properties - Milk yield
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def milk_liters(self) -> float:
-        """Current milk production in liters"""
-        return float(self.get("production", "milk_liters", default=0))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Livestock properties - Animal count
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def animal_count(self) -> int:
-        """Total number of animals"""
-        return int(self.get("livestock", "animal_count", default=0))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Health properties - Disease and stress indicators
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def sick_count(self) -> int:
-        """Number of sick animals"""
-        return int(self.get("health", "sick_count", default=0))
-
-    @property
-    def disease_detected(self) -> bool:
-        """Whether disease has been detected in the herd"""
-        return bool(self.get("health", "disease_detected", default=False))
-
-    @property
-    def stress_signs(self) -> bool:
-        """Whether stress signs have been observed"""
-        return bool(self.get("health", "stress_signs", default=False))
-    #----------------------------------------------------------------------------------------------------------------------------
+class WheatScenarioData(BaseScenarioData):
+    __slots__ = (
+        "tmax",
+        "rain24",
+        "rain48",
+        "wind",
+        "humidity",
+        "soil_moisture",
+        "stage",
+        "water_available",
+        "irrigation_possible_today",
+        "aphids_seen",
+        "rust_seen",
+    )
+
+    def __post_init__(self) -> None:
+        # Weather properties - Temperature, rainfall, wind, humidity
+        self.tmax: float = self.get_float("weather", "t_max_c", default=0.0)                      # Maximum temperature in Celsius
+        self.rain24: float = self.get_float("weather", "rain_mm_24h", default=0.0)                # Rainfall in last 24 hours (mm)
+        self.rain48: float = self.get_float("weather", "forecast_rain_mm_48h", default=0.0)       # Forecasted rainfall in next 48 hours (mm)
+        self.wind: float = self.get_float("weather", "wind_mps", default=0.0)                     # Wind speed in meters per second
+        self.humidity: float = self.get_float("weather", "humidity_pct", default=0.0)             # Relative humidity percentage
+
+        # Soil properties
+        self.soil_moisture: float = self.get_float("soil", "soil_moisture_pct", default=0.0)      # Soil moisture percentage
+
+        # Crop properties
+        self.stage: str = self.get_category("crop", "stage_code", default="unknown")              # Current crop growth stage (e.g., 'tillering', 'flowering')
+
+        # Constraint properties - Resource availability
+        self.water_available: bool = self.get_bool("constraints", "water_available", default=True)  # Whether water is available for irrigation
+        self.irrigation_possible_today: bool = self.get_bool("constraints", "irrigation_possible_today", default=True)  # Whether irrigation is operationally possible today
+
+        # Observation properties - Pest and disease detection
+        self.aphids_seen: bool = self.get_bool("observations", "pest_aphids_seen", default=False)  # Whether aphids have been observed on the crop
+        self.rust_seen: bool = self.get_bool("observations", "disease_rust_seen", default=False)  # Whether rust disease has been observed on the crop
+#----------------------------------------------------------------------------------------------------------------------------
 
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Constraint properties - Resource availability
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def vet_available(self) -> bool:
-        """Whether veterinary services are available"""
-        return bool(self.get("constraints", "vet_available", default=True))
-
-    @property
-    def feed_delivery_expected(self) -> bool:
-        """Whether feed delivery is expected today"""
-        return bool(self.get("constraints", "feed_delivery_expected", default=False))
-    #----------------------------------------------------------------------------------------------------------------------------
+#----------------------------------------------------------------------------------------------------------------------------
+# Livestock-specific scenario data with typed attributes
+# Extends BaseScenarioData with livestock-specific convenience attributes
+#----------------------------------------------------------------------------------------------------------------------------
+@dataclass
+class LivestockScenarioData(BaseScenarioData):
+    __slots__ = (
+        "temperature_c",
+        "humidity_pct",
+        "feed_kg",
+        "water_liters",
+        "milk_liters",
+        "animal_count",
+        "sick_count",
+        "disease_detected",
+        "stress_signs",
+        "vet_available",
+        "feed_delivery_expected",
+    )
+
+    def __post_init__(self) -> None:
+        # Environment properties - Temperature and humidity
+        self.temperature_c: float = self.get_float("environment", "temperature_c", default=20.0)  # Ambient temperature in Celsius
+        self.humidity_pct: float = self.get_float("environment", "humidity_pct", default=60.0)    # Relative humidity percentage
+
+        # Resource properties - Feed and water availability
+        self.feed_kg: float = self.get_float("resources", "feed_kg", default=0.0)                 # Available feed in kilograms
+        self.water_liters: float = self.get_float("resources", "water_liters", default=0.0)       # Available water in liters
+
+        # Production properties - Milk yield
+        self.milk_liters: float = self.get_float("production", "milk_liters", default=0.0)        # Current milk production in liters
+
+        # Livestock properties - Animal count
+        self.animal_count: int = self.get_int("livestock", "animal_count", default=0)             # Total number of animals
+
+        # Health properties - Disease and stress indicators
+        self.sick_count: int = self.get_int("health", "sick_count", default=0)                    # Number of sick animals
+        self.disease_detected: bool = self.get_bool("health", "disease_detected", default=False)  # Whether disease has been detected in the herd
+        self.stress_signs: bool = self.get_bool("health", "stress_signs", default=False)          # Whether stress signs have been observed
+
+        # Constraint properties - Resource availability
+        self.vet_available: bool = self.get_bool("constraints", "vet_available", default=True)    # Whether veterinary services are available
+        self.feed_delivery_expected: bool = self.get_bool("constraints", "feed_delivery_expected", default=False)  # Whether feed delivery is expected today
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
-# Orchard-specific scenario data with typed property accessors
+# Orchard-specific scenario data with typed attributes
 #----------------------------------------------------------------------------------------------------------------------------
 @dataclass
 class OrchardScenarioData(BaseScenarioData):
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Weather properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def temperature(self) -> float:
-        """Temperature in Celsius"""
-        return float(self.get("weather", "temperature_c", default=20))
-
-    @property
-    def humidity(self) -> float:
-        """Humidity percentage"""
-        return float(self.get("weather", "humidity_pct", default=60))
-
-    @property
-    def wind(self) -> float:
-        """Wind speed in km/h"""
-        return float(self.get("weather", "wind_kph", default=0))
-
-    @property
-    def rain24(self) -> float:
-        """Rainfall in last 24 hours (mm)"""
-        return float(self.get("weather", "rain_mm_24h", default=0))
-
-    @property
-    def frost_forecast(self) -> bool:
-        """Whether frost is forecast"""
-        return bool(self.get("weather", "forecast_frost", default=False))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Soil properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def soil_moisture(self) -> float:
-        """Soil moisture percentage"""
-        return float(self.get("soil", "moisture_pct", default=0))
-
-    @property
-    def soil_temp(self) -> float:
-        """Soil temperature in Celsius"""
-        return float(self.get("soil", "soil_temp_c", default=0))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Tree properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def stage(self) -> str:
-        """Current growth stage"""
-        return str(self.get("trees", "stage", default="unknown"))
-
-    @property
-    def fruit_load(self) -> str:
-        """Fruit load level (none/normal/heavy)"""
-        return str(self.get("trees", "fruit_load", default="normal"))
-
-    @property
-    def health_status(self) -> str:
-        """Tree health status"""
-        return str(self.get("trees", "health_status", default="good"))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Pest properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def codling_moth(self) -> bool:
-        """Whether codling moth detected"""
-        return bool(self.get("pests", "codling_moth_detected", default=False))
-
-    @property
-    def aphids(self) -> bool:
-        """Whether aphids detected"""
-        return bool(self.get("pests", "aphids_detected", default=False))
-
-    @property
-    def mites(self) -> bool:
-        """Whether mites detected"""
-        return bool(self.get("pests", "mites_detected", default=False))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Disease properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def fire_blight(self) -> bool:
-        """Whether fire blight signs present"""
-        return bool(self.get("diseases", "fire_blight_signs", default=False))
-
-    @property
-    def scab(self) -> bool:
-        """Whether scab signs present"""
-        return bool(self.get("diseases", "scab_signs", default=False))
-
-    @property
-    def mildew(self) -> bool:
-        """Whether mildew signs present"""
-        return bool(self.get("diseases", "mildew_signs", default=False))
-    #----------------------------------------------------------------------------------------------------------------------------
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Resource properties
-    #----------------------------------------------------------------------------------------------------------------------------
-    @property
-    def water_available(self) -> bool:
-        """Whether water is available"""
-        return bool(self.get("resources", "water_available", default=True))
-
-    @property
-    def labor_available(self) -> bool:
-        """Whether labor is available"""
-        return bool(self.get("resources", "labor_available", default=True))
-    #----------------------------------------------------------------------------------------------------------------------------
+    __slots__ = (
+        "temperature",
+        "humidity",
+        "wind",
+        "rain24",
+        "frost_forecast",
+        "soil_moisture",
+        "soil_temp",
+        "stage",
+        "fruit_load",
+        "health_status",
+        "codling_moth",
+        "aphids",
+        "mites",
+        "fire_blight",
+        "scab",
+        "mildew",
+        "water_available",
+        "labor_available",
+    )
+
+    def __post_init__(self) -> None:
+        # Weather properties
+        self.temperature: float = self.get_float("weather", "temperature_c", default=20.0)        # Temperature in Celsius
+        self.humidity: float = self.get_float("weather", "humidity_pct", default=60.0)            # Humidity percentage
+        self.wind: float = self.get_float("weather", "wind_kph", default=0.0)                     # Wind speed in km/h
+        self.rain24: float = self.get_float("weather", "rain_mm_24h", default=0.0)                # Rainfall in last 24 hours (mm)
+        self.frost_forecast: bool = self.get_bool("weather", "forecast_frost", default=False)     # Whether frost is forecast
+
+        # Soil properties
+        self.soil_moisture: float = self.get_float("soil", "moisture_pct", default=0.0)           # Soil moisture percentage
+        self.soil_temp: float = self.get_float("soil", "soil_temp_c", default=0.0)                # Soil temperature in Celsius
+
+        # Tree properties
+        self.stage: str = self.get_category("trees", "stage", default="unknown")                  # Current growth stage
+        self.fruit_load: str = self.get_category("trees", "fruit_load", default="normal")         # Fruit load level (none/normal/heavy)
+        self.health_status: str = self.get_category("trees", "health_status", default="good")     # Tree health status
+
+        # Pest properties
+        self.codling_moth: bool = self.get_bool("pests", "codling_moth_detected", default=False)  # Whether codling moth detected
+        self.aphids: bool = self.get_bool("pests", "aphids_detected", default=False)              # Whether aphids detected
+        self.mites: bool = self.get_bool("pests", "mites_detected", default=False)                # Whether mites detected
+
+        # Disease properties
+        self.fire_blight: bool = self.get_bool("diseases", "fire_blight_signs", default=False)    # Whether fire blight signs present
+        self.scab: bool = self.get_bool("diseases", "scab_signs", default=False)                  # Whether scab signs present
+        self.mildew: bool = self.get_bool("diseases", "mildew_signs", default=False)              # Whether mildew signs present
+
+        # Resource properties
+        self.water_available: bool = self.get_bool("resources", "water_available", default=True)  # Whether water is available
+        self.labor_available: bool = self.get_bool("resources", "labor_available", default=True)  # Whether labor is available
 #----------------------------------------------------------------------------------------------------------------------------
 
 
@@ -354,57 +290,44 @@ class OrchardScenarioData(BaseScenarioData):
 #----------------------------------------------------------------------------------------------------------------------------
 @dataclass
 class GreenhouseScenarioData(BaseScenarioData):
-    @property
-    def temperature(self) -> float:
-        return float(self.get("environment", "temperature_c", default=20))
-    @property
-    def humidity(self) -> float:
-        return float(self.get("environment", "humidity_pct", default=60))
-    @property
-    def co2_ppm(self) -> float:
-        return float(self.get("environment", "co2_ppm", default=400))
-    @property
-    def light_hours(self) -> float:
-        return float(self.get("environment", "light_hours", default=12))
-    @property
-    def fan_status(self) -> str:
-        return str(self.get("ventilation", "fan_status", default="off"))
-    @property
-    def vent_open_pct(self) -> float:
-        return float(self.get("ventilation", "vent_open_pct", default=0))
-    @property
-    def water_available(self) -> bool:
-        return bool(self.get("irrigation", "water_available", default=True))
-    @property
-    def soil_moisture(self) -> float:
-        return float(self.get("irrigation", "soil_moisture_pct", default=0))
-    @property
-    def last_watered_hours(self) -> float:
-        return float(self.get("irrigation", "last_watered_hours", default=24))
-    @property
-    def stage(self) -> str:
-        return str(self.get("crops", "stage", default="unknown"))
-    @property
-    def health(self) -> str:
-        return str(self.get("crops", "health", default="good"))
-    @property
-    def whiteflies(self) -> bool:
-        return bool(self.get("pests", "whiteflies", default=False))
-    @property
-    def thrips(self) -> bool:
-        return bool(self.get("pests", "thrips", default=False))
-    @property
-    def aphids(self) -> bool:
-        return bool(self.get("pests", "aphids", default=False))
-    @property
-    def fungal_signs(self) -> bool:
-        return bool(self.get("diseases", "fungal_signs", default=False))
-    @property
-    def bacterial_signs(self) -> bool:
-        return bool(self.get("diseases", "bacterial_signs", default=False))
-    @property
-    def virus_signs(self) -> bool:
-        return bool(self.get("diseases", "virus_signs", default=False))
+    __slots__ = (
+        "temperature",
+        "humidity",
+        "co2_ppm",
+        "light_hours",
+        "fan_status",
+        "vent_open_pct",
+        "water_available",
+        "soil_moisture",
+        "last_watered_hours",
+        "stage",
+        "health",
+        "whiteflies",
+        "thrips",
+        "aphids",
+        "fungal_signs",
+        "bacterial_signs",
+        "virus_signs",
+    )
+
+    def __post_init__(self) -> None:
+        self.temperature: float = self.get_float("environment", "temperature_c", default=20.0)
+        self.humidity: float = self.get_float("environment", "humidity_pct", default=60.0)
+        self.co2_ppm: float = self.get_float("environment", "co2_ppm", default=400.0)
+        self.light_hours: float = self.get_float("environment", "light_hours", default=12.0)
+        self.fan_status: str = self.get_category("ventilation", "fan_status", default="off")
+        self.vent_open_pct: float = self.get_float("ventilation", "vent_open_pct", default=0.0)
+        self.water_available: bool = self.get_bool("irrigation", "water_available", default=True)
+        self.soil_moisture: float = self.get_float("irrigation", "soil_moisture_pct", default=0.0)
+        self.last_watered_hours: float = self.get_float("irrigation", "last_watered_hours", default=24.0)
+        self.stage: str = self.get_category("crops", "stage", default="unknown")
+        self.health: str = self.get_category("crops", "health", default="good")
+        self.whiteflies: bool = self.get_bool("pests", "whiteflies", default=False)
+        self.thrips: bool = self.get_bool("pests", "thrips", default=False)
+        self.aphids: bool = self.get_bool("pests", "aphids", default=False)
+        self.fungal_signs: bool = self.get_bool("diseases", "fungal_signs", default=False)
+        self.bacterial_signs: bool = self.get_bool("diseases", "bacterial_signs", default=False)
+        self.virus_signs: bool = self.get_bool("diseases", "virus_signs", default=False)
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -412,46 +335,36 @@ class GreenhouseScenarioData(BaseScenarioData):
 #----------------------------------------------------------------------------------------------------------------------------
 @dataclass
 class MixedScenarioData(BaseScenarioData):
-    @property
-    def soil_moisture(self) -> float:
-        return float(self.get("crops", "soil_moisture_pct", default=0))
-    @property
-    def crop_stage(self) -> str:
-        return str(self.get("crops", "stage", default="unknown"))
-    @property
-    def crop_health(self) -> str:
-        return str(self.get("crops", "health", default="good"))
-    @property
-    def pest_pressure(self) -> str:
-        return str(self.get("crops", "pest_pressure", default="low"))
-    @property
-    def animal_count(self) -> int:
-        return int(self.get("livestock", "animal_count", default=0))
-    @property
-    def feed_kg(self) -> float:
-        return float(self.get("livestock", "feed_kg", default=0))
-    @property
-    def water_liters(self) -> float:
-        return float(self.get("livestock", "water_liters", default=0))
-    @property
-    def sick_count(self) -> int:
-        return int(self.get("livestock", "sick_count", default=0))
-    @property
-    def labor_hours(self) -> float:
-        return float(self.get("resources", "labor_hours", default=8))
-    @property
-    def water_available(self) -> bool:
-        return bool(self.get("resources", "water_available", default=True))
-    @property
-    def budget_available(self) -> bool:
-        return bool(self.get("resources", "budget_available", default=True))
-    @property
-    def temperature(self) -> float:
-        return float(self.get("weather", "temperature_c", default=20))
-    @property
-    def rain24(self) -> float:
-        return float(self.get("weather", "rain_mm_24h", default=0))
-    @property
-    def rain48_forecast(self) -> float:
-        return float(self.get("weather", "forecast_rain_48h", default=0))
+    __slots__ = (
+        "soil_moisture",
+        "crop_stage",
+        "crop_health",
+        "pest_pressure",
+        "animal_count",
+        "feed_kg",
+        "water_liters",
+        "sick_count",
+        "labor_hours",
+        "water_available",
+        "budget_available",
+        "temperature",
+        "rain24",
+        "rain48_forecast",
+    )
+
+    def __post_init__(self) -> None:
+        self.soil_moisture: float = self.get_float("crops", "soil_moisture_pct", default=0.0)
+        self.crop_stage: str = self.get_category("crops", "stage", default="unknown")
+        self.crop_health: str = self.get_category("crops", "health", default="good")
+        self.pest_pressure: str = self.get_category("crops", "pest_pressure", default="low")
+        self.animal_count: int = self.get_int("livestock", "animal_count", default=0)
+        self.feed_kg: float = self.get_float("livestock", "feed_kg", default=0.0)
+        self.water_liters: float = self.get_float("livestock", "water_liters", default=0.0)
+        self.sick_count: int = self.get_int("livestock", "sick_count", default=0)
+        self.labor_hours: float = self.get_float("resources", "labor_hours", default=8.0)
+        self.water_available: bool = self.get_bool("resources", "water_available", default=True)
+        self.budget_available: bool = self.get_bool("resources", "budget_available", default=True)
+        self.temperature: float = self.get_float("weather", "temperature_c", default=20.0)
+        self.rain24: float = self.get_float("weather", "rain_mm_24h", default=0.0)
+        self.rain48_forecast: float = self.get_float("weather", "forecast_rain_48h", default=0.0)
 #----------------------------------------------------------------------------------------------------------------------------
@@ -7,7 +7,8 @@
 # IMPORTS
 from backend.schema import BaseScenarioData, ModelOutput
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Type
+from dataclasses import fields
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -23,6 +24,37 @@ class BaseModel(ABC):
     # Each subclass must define which ScenarioData class to use
     scenario_data_class: Type[BaseScenarioData] = BaseScenarioData
 
+    # Each subclass lists its _rule_* method names in evaluation order
+    # Resolved once per class into _rules so _apply_rules skips per-call attribute lookups
+    rule_order: Tuple[str, ...] = ()
+    _rules: Tuple[Callable[..., None], ...] = ()
+
+    # Optional context dataclass for the default _build_struct
+    # Its fields must match scenario_data_class attribute names, plus a 'derived' field for the derived buckets
+    struct_class: Optional[type] = None
+    _struct_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # ABCMeta only fills __abstractmethods__ after this hook, so concreteness is checked by hand
+        # Concrete models must be complete at class definition, not fail on their first request
+        concrete = not any(
+            getattr(getattr(cls, name), "__isabstractmethod__", False) for name in BaseModel.__abstractmethods__
+        )
+        for name in cls.rule_order:
+            if not (name.startswith("_rule_") and callable(getattr(cls, name, None))):
+                raise TypeError(f"{cls.__name__}.rule_order entry {name!r} is not a _rule_* method")
+        if concrete and not cls.rule_order and cls._apply_rules is BaseModel._apply_rules:
+            raise TypeError(f"{cls.__name__} must set rule_order or override _apply_rules")
+        cls._rules = tuple(getattr(cls, name) for name in cls.rule_order)
+        if cls.struct_class is not None:
+            names = [f.name for f in fields(cls.struct_class)]
+            if "derived" not in names:
+                raise TypeError(f"{cls.struct_class.__name__} must declare a 'derived' field")
+            cls._struct_fields = tuple(name for name in names if name != "derived")
+        elif concrete and cls._build_struct is BaseModel._build_struct:
+            raise TypeError(f"{cls.__name__} must set struct_class or override _build_struct")
+
     #----------------------------------------------------------------------------------------------------------------------------
     # Main entry point - Executes the model workflow
     # Orchestrates parsing, deriving, rule application, and conflict resolution
@@ -65,31 +97,22 @@ class BaseModel(ABC):
     # Resolve conflicts between recommendations and restrictions
     # Rules: 1) Highest priority wins for duplicates, 2) Not-recommended always blocks recommended
     def _resolve_conflicts(self, recs, not_recs):
-         # Index by code
+        # Index not-recommended first (last wins; could also merge reasons) so blocked codes are skipped below
+        not_by_code: Dict[str, Dict[str, Any]] = {n["code"]: n for n in not_recs}
+
+        # Single pass over recs: drop blocked codes, keep highest priority if duplicates
+        rank = PRIORITY_RANK.get
         rec_by_code: Dict[str, Dict[str, Any]] = {}
         for r in recs:
             code = r["code"]
-            # keep highest priority if duplicates
-            if code not in rec_by_code:
-                rec_by_code[code] = r
-            else:
-                if PRIORITY_RANK.get(r.get("priority", "low"), 1) > PRIORITY_RANK.get(rec_by_code[code].get("priority", "low"), 1):
-                    rec_by_code[code] = r
-
-        not_by_code: Dict[str, Dict[str, Any]] = {}
-        for n in not_recs:
-            code = n["code"]
-            not_by_code[code] = n  # last wins; could also merge reasons
-
-        # Conflict: if code exists in not_recommended, remove from recommendations
-        for code in list(rec_by_code.keys()):
             if code in not_by_code:
-                del rec_by_code[code]
+                continue
+            current = rec_by_code.get(code)
+            if current is None or rank(r.get("priority", "low"), 1) > rank(current.get("priority", "low"), 1):
+                rec_by_code[code] = r
 
         # Return clean lists
-        final_recs = list(rec_by_code.values())
-        final_not = list(not_by_code.values())
-        return final_recs, final_not
+        return list(rec_by_code.values()), list(not_by_code.values())
     #----------------------------------------------------------------------------------------------------------------------------
 
     #----------------------------------------------------------------------------------------------------------------------------
@@ -106,14 +129,19 @@ class BaseModel(ABC):
     def _derive(self, di):
         """Compute derived buckets from raw sensor data"""
         ...
+    #----------------------------------------------------------------------------------------------------------------------------
 
-    @abstractmethod
+    #----------------------------------------------------------------------------------------------------------------------------
+    # Build farm-specific context structure for rule evaluation
+    # Default copies same-named scenario attributes into struct_class; models with renamed fields override it
     def _build_struct(self, di, derived):
-        """Build farm-specific context structure for rule evaluation"""
-        ...
+        return self.struct_class(**{name: getattr(di, name) for name in self._struct_fields}, derived=derived)
+    #----------------------------------------------------------------------------------------------------------------------------
 
-    @abstractmethod
+    #----------------------------------------------------------------------------------------------------------------------------
+    # Apply all farm-specific decision rules in rule_order
+    # Every rule takes (ctx, recs, not_recs) and appends to the lists in place
     def _apply_rules(self, ctx, recs, not_recs):
-        """Apply all farm-specific decision rules"""
-        ...
+        for rule in self._rules:
+            rule(self, ctx, recs, not_recs)
     #----------------------------------------------------------------------------------------------------------------------------
\ No newline at end of file
@@ -13,28 +13,7 @@ from ..rules_catalog import reason
 class GreenhouseModel(BaseModel):
     name = "greenhouse"
     scenario_data_class = GreenhouseScenarioData
-
-    def _build_struct(self, di, derived):
-        return GreenhouseStruct(
-            temperature=di.temperature,
-            humidity=di.humidity,
-            co2_ppm=di.co2_ppm,
-            light_hours=di.light_hours,
-            fan_status=di.fan_status,
-            vent_open_pct=di.vent_open_pct,
-            water_available=di.water_available,
-            soil_moisture=di.soil_moisture,
-            last_watered_hours=di.last_watered_hours,
-            stage=di.stage,
-            health=di.health,
-            whiteflies=di.whiteflies,
-            thrips=di.thrips,
-            aphids=di.aphids,
-            fungal_signs=di.fungal_signs,
-            bacterial_signs=di.bacterial_signs,
-            virus_signs=di.virus_signs,
-            derived=derived,
-        )
+    struct_class = GreenhouseStruct
 
     def _derive(self, di) -> Dict[str, Any]:
         # Temperature status
@@ -201,11 +180,12 @@ class GreenhouseModel(BaseModel):
                 [reason("crop_health_poor")]
             )
 
-    def _apply_rules(self, ctx, recs, not_recs):
-        self._rule_temperature_control(ctx, recs, not_recs)
-        self._rule_humidity_control(ctx, recs, not_recs)
-        self._rule_ventilation(ctx, recs, not_recs)
-        self._rule_irrigation(ctx, recs, not_recs)
-        self._rule_pest_management(ctx, recs, not_recs)
-        self._rule_disease_management(ctx, recs, not_recs)
-        self._rule_crop_management(ctx, recs, not_recs)
+    rule_order = (
+        "_rule_temperature_control",
+        "_rule_humidity_control",
+        "_rule_ventilation",
+        "_rule_irrigation",
+        "_rule_pest_management",
+        "_rule_disease_management",
+        "_rule_crop_management",
+    )
@@ -5,7 +5,7 @@
 from dataclasses import dataclass
 from typing import Any, Dict
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GreenhouseStruct:
     # Environment
     temperature: float
@@ -59,12 +59,19 @@ class LivestockModel(BaseModel):
         expected_yield = di.animal_count * 20  # Expected ~20L per cow per day
         milk_bucket = "low" if di.milk_liters < expected_yield * 0.7 else ("adequate" if di.milk_liters < expected_yield * 0.9 else "good")
 
+        # Water supply bucket (dairy cows need ~80-100L per day)
+        required_water = di.animal_count * 80
+        water_per_animal = di.water_liters / di.animal_count if di.animal_count > 0 else 0
+        water_status = "critical" if di.water_liters < required_water * 0.5 else ("low" if di.water_liters < required_water else "adequate")
+
         return {
             "feed_status": feed_status,
             "health_bucket": health_bucket,
             "temp_stress": temp_stress,
             "milk_bucket": milk_bucket,
             "feed_per_animal": round(feed_per_animal, 1),
+            "water_status": water_status,
+            "water_per_animal": round(water_per_animal, 1),
         }
     #----------------------------------------------------------------------------------------------------------------------------
 
@@ -209,44 +216,44 @@ class LivestockModel(BaseModel):
     # Water management rule
     # Ensures adequate water supply for dairy cattle
     def _rule_water_management(self, ctx: LivestockStruct, recs, not_recs) -> None:
-        # Calculate required water (dairy cows need ~80-100L per day)
-        required_water = ctx.animal_count * 80
-        water_per_animal = ctx.water_liters / ctx.animal_count if ctx.animal_count > 0 else 0
+        water_status = ctx.derived["water_status"]
+        water_per_animal = ctx.derived["water_per_animal"]
 
         # Critical water shortage
-        if ctx.water_liters < required_water * 0.5:
+        if water_status == "critical":
             self._add_rec(
                 recs,
                 "REFILL_WATER_URGENT",
                 "high",
                 [
-                    reason("water_critical", per_animal=round(water_per_animal, 1)),
+                    reason("water_critical", per_animal=water_per_animal),
                     reason("dehydration_risk"),
                 ]
             )
 
         # Low water supply
-        elif ctx.water_liters < required_water:
+        elif water_status == "low":
             self._add_rec(
                 recs,
                 "REFILL_WATER_TODAY",
                 "medium",
-                [reason("water_low", per_animal=round(water_per_animal, 1))]
+                [reason("water_low", per_animal=water_per_animal)]
             )
     #----------------------------------------------------------------------------------------------------------------------------
 
     #----------------------------------------------------------------------------------------------------------------------------
     # Apply all livestock decision rules
     # Evaluates all rule categories and populates recommendations and not-recommended lists
-    def _apply_rules(self, ctx, recs, not_recs):
+    rule_order = (
         # Check feeding needs
-        self._rule_feeding(ctx, recs, not_recs)
+        "_rule_feeding",
         # Monitor health and disease
-        self._rule_health_monitoring(ctx, recs, not_recs)
+        "_rule_health_monitoring",
         # Manage heat stress
-        self._rule_heat_stress(ctx, recs, not_recs)
+        "_rule_heat_stress",
         # Optimize milking schedule
-        self._rule_milking_schedule(ctx, recs, not_recs)
+        "_rule_milking_schedule",
         # Ensure water supply
-        self._rule_water_management(ctx, recs, not_recs)
+        "_rule_water_management",
+    )
     #----------------------------------------------------------------------------------------------------------------------------
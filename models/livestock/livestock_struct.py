@@ -12,7 +12,7 @@ from typing import Any, Dict
 #----------------------------------------------------------------------------------------------------------------------------
 # Livestock context structure - Immutable snapshot for dairy cattle decisions
 #----------------------------------------------------------------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LivestockStruct:
     # Environmental inputs
     temperature: float       # Current temperature (Celsius)
@@ -36,5 +36,5 @@ class LivestockStruct:
     feed_delivery_today: bool  # Whether feed delivery expected
 
     # Derived buckets (computed from raw inputs)
-    derived: Dict[str, Any]  # Contains: feed_status, health_bucket, temp_stress, milk_bucket
+    derived: Dict[str, Any]  # Contains: feed_status, health_bucket, temp_stress, milk_bucket, water_status, water_per_animal
 #----------------------------------------------------------------------------------------------------------------------------
@@ -9,34 +9,19 @@ from backend.schema import MixedScenarioData
 from .mixed_struct import MixedStruct
 from ..rules_catalog import reason
 
+# Crop stages where low soil moisture is critical (built once for constant-time membership tests)
+_CRITICAL_CROP_STAGES = frozenset(("flowering", "fruit_development"))
+
 @register_model("mixed")
 class MixedModel(BaseModel):
     name = "mixed"
     scenario_data_class = MixedScenarioData
-
-    def _build_struct(self, di, derived):
-        return MixedStruct(
-            soil_moisture=di.soil_moisture,
-            crop_stage=di.crop_stage,
-            crop_health=di.crop_health,
-            pest_pressure=di.pest_pressure,
-            animal_count=di.animal_count,
-            feed_kg=di.feed_kg,
-            water_liters=di.water_liters,
-            sick_count=di.sick_count,
-            labor_hours=di.labor_hours,
-            water_available=di.water_available,
-            budget_available=di.budget_available,
-            temperature=di.temperature,
-            rain24=di.rain24,
-            rain48_forecast=di.rain48_forecast,
-            derived=derived,
-        )
+    struct_class = MixedStruct
 
     def _derive(self, di) -> Dict[str, Any]:
         # Crop status
         crop_needs_water = di.soil_moisture < 20
-        crop_critical = di.crop_stage in ["flowering", "fruit_development"] and di.soil_moisture < 18
+        crop_critical = di.crop_stage in _CRITICAL_CROP_STAGES and di.soil_moisture < 18
 
         # Livestock status
         feed_per_animal = di.feed_kg / di.animal_count if di.animal_count > 0 else 0
@@ -46,7 +31,7 @@ class MixedModel(BaseModel):
 
         # Resource constraints
         labor_limited = di.labor_hours < 6
-        multiple_needs = sum([crop_needs_water, feed_critical, water_critical, di.sick_count > 0]) >= 2
+        multiple_needs = (crop_needs_water + feed_critical + water_critical + (di.sick_count > 0)) >= 2
 
         return {
             "crop_needs_water": crop_needs_water,
@@ -64,7 +49,8 @@ class MixedModel(BaseModel):
             self._add_not(not_recs, "IRRIGATE_CROPS", [reason("no_water_mixed")])
             return
 
-        if ctx.derived["crop_critical"]:
+        derived = ctx.derived
+        if derived["crop_critical"]:
             self._add_rec(
                 recs,
                 "IRRIGATE_CROPS_URGENT",
@@ -74,7 +60,7 @@ class MixedModel(BaseModel):
                     reason("soil_moisture_low", sm=ctx.soil_moisture),
                 ]
             )
-        elif ctx.derived["crop_needs_water"] and not ctx.derived["water_critical"]:
+        elif derived["crop_needs_water"] and not derived["water_critical"]:
             self._add_rec(
                 recs,
                 "IRRIGATE_CROPS",
@@ -83,22 +69,24 @@ class MixedModel(BaseModel):
             )
 
     def _rule_livestock_feeding(self, ctx: MixedStruct, recs, not_recs) -> None:
+        feed_per_animal = ctx.derived["feed_per_animal"]
+
         if ctx.derived["feed_critical"]:
             self._add_rec(
                 recs,
                 "FEED_ANIMALS_URGENT",
                 "high",
                 [
-                    reason("feed_critical_mixed", per_animal=ctx.derived["feed_per_animal"]),
+                    reason("feed_critical_mixed", per_animal=feed_per_animal),
                     reason("animal_welfare_risk", count=ctx.animal_count),
                 ]
             )
-        elif ctx.derived["feed_per_animal"] < 5:
+        elif feed_per_animal < 5:
             self._add_rec(
                 recs,
                 "ORDER_FEED_MIXED",
                 "medium",
-                [reason("feed_low_mixed", per_animal=ctx.derived["feed_per_animal"])]
+                [reason("feed_low_mixed", per_animal=feed_per_animal)]
             )
 
     def _rule_livestock_watering(self, ctx: MixedStruct, recs, not_recs) -> None:
@@ -156,7 +144,9 @@ class MixedModel(BaseModel):
             )
 
     def _rule_resource_allocation(self, ctx: MixedStruct, recs, not_recs) -> None:
-        if ctx.derived["labor_limited"] and ctx.derived["multiple_needs"]:
+        derived = ctx.derived
+
+        if derived["labor_limited"] and derived["multiple_needs"]:
             self._add_rec(
                 recs,
                 "PRIORITIZE_TASKS",
@@ -168,7 +158,7 @@ class MixedModel(BaseModel):
                 ]
             )
 
-        if not ctx.budget_available and (ctx.derived["feed_critical"] or ctx.derived["crop_critical"]):
+        if not ctx.budget_available and (derived["feed_critical"] or derived["crop_critical"]):
             self._add_rec(
                 recs,
                 "SECURE_EMERGENCY_FUNDS",
@@ -195,13 +185,14 @@ class MixedModel(BaseModel):
                 [reason("heavy_rain_runoff", rain=ctx.rain24)]
             )
 
-    def _apply_rules(self, ctx, recs, not_recs):
+    rule_order = (
         # Priority order: health, water, feed, crops, pests, harvest, resources
-        self._rule_health_management(ctx, recs, not_recs)
-        self._rule_livestock_watering(ctx, recs, not_recs)
-        self._rule_livestock_feeding(ctx, recs, not_recs)
-        self._rule_crop_irrigation(ctx, recs, not_recs)
-        self._rule_pest_management(ctx, recs, not_recs)
-        self._rule_harvest_management(ctx, recs, not_recs)
-        self._rule_resource_allocation(ctx, recs, not_recs)
-        self._rule_weather_planning(ctx, recs, not_recs)
+        "_rule_health_management",
+        "_rule_livestock_watering",
+        "_rule_livestock_feeding",
+        "_rule_crop_irrigation",
+        "_rule_pest_management",
+        "_rule_harvest_management",
+        "_rule_resource_allocation",
+        "_rule_weather_planning",
+    )
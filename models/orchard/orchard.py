@@ -13,38 +13,19 @@ from .orchard_struct import OrchardStruct
 from ..rules_catalog import reason
 #----------------------------------------------------------------------------------------------------------------------------
 
+#----------------------------------------------------------------------------------------------------------------------------
+# Growth stage sets - Built once at import for constant-time membership tests
+_IRRIGATION_CRITICAL_STAGES = frozenset(("fruit_development", "flowering"))  # Low moisture escalates irrigation to high
+_FROST_SENSITIVE_STAGES = frozenset(("flowering", "early_growth"))          # Frost forecast triggers protection
+#----------------------------------------------------------------------------------------------------------------------------
+
 #----------------------------------------------------------------------------------------------------------------------------
 # Orchard model class - Auto-registered via decorator
 @register_model("orchard")
 class OrchardModel(BaseModel):
     name = "orchard"
     scenario_data_class = OrchardScenarioData
-
-    #----------------------------------------------------------------------------------------------------------------------------
-    # Build orchard context structure from scenario data and derived buckets
-    def _build_struct(self, di, derived):
-        return OrchardStruct(
-            temperature=di.temperature,
-            humidity=di.humidity,
-            wind=di.wind,
-            rain24=di.rain24,
-            frost_forecast=di.frost_forecast,
-            soil_moisture=di.soil_moisture,
-            soil_temp=di.soil_temp,
-            stage=di.stage,
-            fruit_load=di.fruit_load,
-            health_status=di.health_status,
-            codling_moth=di.codling_moth,
-            aphids=di.aphids,
-            mites=di.mites,
-            fire_blight=di.fire_blight,
-            scab=di.scab,
-            mildew=di.mildew,
-            water_available=di.water_available,
-            labor_available=di.labor_available,
-            derived=derived,
-        )
-    #----------------------------------------------------------------------------------------------------------------------------
+    struct_class = OrchardStruct
 
     #----------------------------------------------------------------------------------------------------------------------------
     # Derive decision buckets from raw sensor values
@@ -77,9 +58,10 @@ class OrchardModel(BaseModel):
             return
 
         moisture_bucket = ctx.derived["moisture_bucket"]
+        wet_conditions = ctx.derived["wet_conditions"]
 
         # Critical irrigation need
-        if moisture_bucket == "low" and ctx.stage in ["fruit_development", "flowering"]:
+        if moisture_bucket == "low" and ctx.stage in _IRRIGATION_CRITICAL_STAGES:
             self._add_rec(
                 recs,
                 "IRRIGATE_ORCHARD",
@@ -98,7 +80,7 @@ class OrchardModel(BaseModel):
                 [reason("soil_moisture_low", sm=ctx.soil_moisture)]
             )
         # Too wet - don't irrigate
-        elif ctx.derived["wet_conditions"] or moisture_bucket == "high":
+        elif wet_conditions or moisture_bucket == "high":
             self._add_not(
                 not_recs,
                 "IRRIGATE_ORCHARD",
@@ -109,7 +91,7 @@ class OrchardModel(BaseModel):
     #----------------------------------------------------------------------------------------------------------------------------
     # Frost protection rule
     def _rule_frost_protection(self, ctx: OrchardStruct, recs, not_recs) -> None:
-        if ctx.frost_forecast and ctx.stage in ["flowering", "early_growth"]:
+        if ctx.frost_forecast and ctx.stage in _FROST_SENSITIVE_STAGES:
             self._add_rec(
                 recs,
                 "ACTIVATE_FROST_PROTECTION",
@@ -211,7 +193,9 @@ class OrchardModel(BaseModel):
     #----------------------------------------------------------------------------------------------------------------------------
     # Fertilization rule
     def _rule_fertilization(self, ctx: OrchardStruct, recs, not_recs) -> None:
-        if ctx.stage == "early_growth" and ctx.derived["moisture_bucket"] == "adequate":
+        derived = ctx.derived
+
+        if ctx.stage == "early_growth" and derived["moisture_bucket"] == "adequate":
             self._add_rec(
                 recs,
                 "FERTILIZE_ORCHARD",
@@ -221,7 +205,7 @@ class OrchardModel(BaseModel):
                     reason("soil_moisture_adequate", sm=ctx.soil_moisture),
                 ]
             )
-        elif ctx.derived["wet_conditions"]:
+        elif derived["wet_conditions"]:
             self._add_not(
                 not_recs,
                 "FERTILIZE_ORCHARD",
@@ -273,13 +257,14 @@ class OrchardModel(BaseModel):
 
     #----------------------------------------------------------------------------------------------------------------------------
     # Apply all orchard decision rules
-    def _apply_rules(self, ctx, recs, not_recs):
-        self._rule_irrigation(ctx, recs, not_recs)
-        self._rule_frost_protection(ctx, recs, not_recs)
-        self._rule_pest_management(ctx, recs, not_recs)
-        self._rule_disease_management(ctx, recs, not_recs)
-        self._rule_fruit_thinning(ctx, recs, not_recs)
-        self._rule_fertilization(ctx, recs, not_recs)
-        self._rule_harvest(ctx, recs, not_recs)
-        self._rule_storm_preparation(ctx, recs, not_recs)
+    rule_order = (
+        "_rule_irrigation",
+        "_rule_frost_protection",
+        "_rule_pest_management",
+        "_rule_disease_management",
+        "_rule_fruit_thinning",
+        "_rule_fertilization",
+        "_rule_harvest",
+        "_rule_storm_preparation",
+    )
     #----------------------------------------------------------------------------------------------------------------------------
@@ -13,7 +13,7 @@ from typing import Any, Dict
 # Orchard context dataclass - Contains all sensor data and derived buckets
 # Used as input to all orchard rule functions
 #----------------------------------------------------------------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrchardStruct:
     # Weather data
     temperature: float
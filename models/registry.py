@@ -5,7 +5,7 @@
 
 #----------------------------------------------------------------------------------------------------------------------------
 # IMPORTS
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from models.base import BaseModel
 from models.rules_catalog import create_formatter
 #----------------------------------------------------------------------------------------------------------------------------
@@ -15,6 +15,9 @@ from models.rules_catalog import create_formatter
 # Maps farm type names to their model instances
 #----------------------------------------------------------------------------------------------------------------------------
 _REGISTRY: Dict[str, BaseModel] = {}
+
+# Sorted farm types, rebuilt on first read after a registration
+_SORTED_FARM_TYPES: Optional[Tuple[str, ...]] = None
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -49,8 +52,10 @@ def register_model(farm_type: str):
         - Automatically creates formatter using create_formatter()
     """
     def decorator(cls):
-    # Store class (not instance) for lazy instantiation
-        _REGISTRY[farm_type] = cls
+        global _SORTED_FARM_TYPES
+        # Store a single shared instance - models are stateless, so one per farm type is enough
+        _REGISTRY[farm_type] = cls()
+        _SORTED_FARM_TYPES = None
         
         # Auto-create and register formatter for this farm type
         _FORMATTERS[farm_type] = create_formatter(farm_type)
@@ -74,7 +79,10 @@ def get_available_farm_types() -> List[str]:
         >>> get_available_farm_types()
         ['wheat', 'livestock', 'orchard']
     """
-    return sorted(_REGISTRY.keys())
+    global _SORTED_FARM_TYPES
+    if _SORTED_FARM_TYPES is None:
+        _SORTED_FARM_TYPES = tuple(sorted(_REGISTRY))
+    return list(_SORTED_FARM_TYPES)
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -93,14 +101,10 @@ def get_model(name: str) -> BaseModel:
     Raises:
         ValueError: If farm type not registered
     """
-    try:
-        model_cls = _REGISTRY[name]
-        # Lazy instantiation - create only when needed
-        if isinstance(model_cls, type):
-            return model_cls()
-        return model_cls
-    except KeyError:
+    model = _REGISTRY.get(name)
+    if model is None:
         raise ValueError(f"Unknown model: {name}. Available: {list(_REGISTRY.keys())}")
+    return model
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
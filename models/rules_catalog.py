@@ -7,7 +7,8 @@
 #----------------------------------------------------------------------------------------------------------------------------
 # IMPORTS
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 #----------------------------------------------------------------------------------------------------------------------------
 
 #----------------------------------------------------------------------------------------------------------------------------
@@ -248,6 +249,63 @@ _VALUE_STRINGS = {
 }
 #----------------------------------------------------------------------------------------------------------------------------
 
+#----------------------------------------------------------------------------------------------------------------------------
+# Shared read-only empty defaults (avoid a fresh {} / [] per lookup)
+# _NO_STRINGS: languages without value/bool translations; _NO_REASONS: actions without reasons
+#----------------------------------------------------------------------------------------------------------------------------
+_NO_STRINGS: Mapping[Any, str] = MappingProxyType({})
+_NO_REASONS: Tuple[Reason, ...] = ()
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Template resolution with fallbacks: requested language -> 'az', unknown farm type -> wheat templates
+#----------------------------------------------------------------------------------------------------------------------------
+def _resolve_templates(farm_type: str, language: str) -> Dict[str, str]:
+    """
+    Pick the template table for a farm type and language, applying the fallbacks.
+
+    Args:
+        farm_type: Farm type whose templates are wanted
+        language: Target language code
+
+    Returns:
+        Reason key -> str.format template; filled by format_reason via template.format_map(params),
+        templates whose placeholders are missing from params are returned unformatted
+    """
+    farm_templates = _TEMPLATES.get(farm_type, {})
+    templates = farm_templates.get(language) or farm_templates.get("az") or {}
+
+    # Fallback to wheat templates if farm type not found
+    if not templates:
+        templates = _TEMPLATES.get("wheat", {}).get(language, {})
+    return templates
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Flattened template table - (farm_type, language, key) -> template, fallbacks pre-resolved at import
+# Covers every registered farm type x known language; anything else takes the _resolve_templates path
+# Rebuild with _build_flat_templates() if _TEMPLATES is changed at runtime
+#----------------------------------------------------------------------------------------------------------------------------
+def _build_flat_templates() -> Dict[Tuple[str, str, str], str]:
+    """
+    Flatten _TEMPLATES into a single-lookup table with fallbacks already applied.
+
+    Returns:
+        (farm_type, language, key) -> template, so format_reason needs one dict lookup per reason;
+        each (farm_type, language) pair maps to exactly what _resolve_templates would return,
+        and templates keep the same format_map contract
+    """
+    languages = {language for farm_templates in _TEMPLATES.values() for language in farm_templates}
+    return {
+        (farm_type, language, key): template
+        for farm_type in _TEMPLATES
+        for language in languages
+        for key, template in _resolve_templates(farm_type, language).items()
+    }
+
+_TEMPLATES_FLAT: Dict[Tuple[str, str, str], str] = _build_flat_templates()
+#----------------------------------------------------------------------------------------------------------------------------
+
 #----------------------------------------------------------------------------------------------------------------------------
 # Create a structured reason object with key and parameters
 #----------------------------------------------------------------------------------------------------------------------------
@@ -277,11 +335,18 @@ def _normalize_params(params: Dict[str, Any], language: str = "az") -> Dict[str,
         language: Target language code (default: 'az')
 
     Returns:
-        Dictionary with translated parameter values
+        Dictionary with translated parameter values (params itself if nothing needs translating)
     """
+    # Fast path: purely numeric params (the common case) pass through without a copy
+    for value in params.values():
+        if isinstance(value, (bool, str)):
+            break
+    else:
+        return params
+
     out: Dict[str, Any] = {}
-    value_map = _VALUE_STRINGS.get(language, {})
-    bool_map = _BOOL_STRINGS.get(language, {})
+    value_map = _VALUE_STRINGS.get(language, _NO_STRINGS)
+    bool_map = _BOOL_STRINGS.get(language, _NO_STRINGS)
 
     for name, value in params.items():
         # Translate boolean values
@@ -312,29 +377,26 @@ def format_reason(reason_item: Any, farm_type: str = "wheat", language: str = "a
     Returns:
         Formatted localized string
     """
-    # Handle raw strings
-    if isinstance(reason_item, str):
-        return reason_item
-    if not isinstance(reason_item, dict):
-        return str(reason_item)
+    # Handle raw strings (plain dicts from reason() skip the isinstance checks, subclasses still take them)
+    if type(reason_item) is not dict:
+        if isinstance(reason_item, str):
+            return reason_item
+        if not isinstance(reason_item, dict):
+            return str(reason_item)
 
     key = reason_item.get("key", "")
     params = reason_item.get("params", {}) or {}
 
-    # Get template for the farm type and language
-    farm_templates = _TEMPLATES.get(farm_type, {})
-    templates = farm_templates.get(language) or farm_templates.get("az") or {}
-
-    # Fallback to wheat templates if farm type not found
-    if not templates:
-        templates = _TEMPLATES.get("wheat", {}).get(language, {})
-
-    template = templates.get(key, key)
+    # Get template for the farm type and language (single lookup for known combinations)
+    template = _TEMPLATES_FLAT.get((farm_type, language, key))
+    if template is None:
+        template = _resolve_templates(farm_type, language).get(key, key)
 
     # Normalize parameters and fill template
+    # format_map reads the dict directly instead of unpacking it into a fresh kwargs dict
     normalized = _normalize_params(params, language)
     try:
-        return template.format(**normalized)
+        return template.format_map(normalized)
     except (KeyError, ValueError):
         return template
 #----------------------------------------------------------------------------------------------------------------------------
@@ -373,18 +435,23 @@ def format_actions(actions: Iterable[Action], farm_type: str = "wheat", language
         List of actions with both localized reasons and original structured reasons
     """
     formatted: List[Action] = []
+    value_map = _VALUE_STRINGS.get(language, _NO_STRINGS)
     for action in actions:
-        reasons_structured = action.get("reasons", [])
+        reasons_structured = action.get("reasons", _NO_REASONS)
         localized = format_reasons(reasons_structured, farm_type, language)
 
-        # Create new action with both formats
-        new_action = dict(action)
-        new_action["reasons"] = localized                      # Human-readable localized strings
-        new_action["reasons_structured"] = reasons_structured  # Original structured format for LLM/chat
+        # Create new action with both formats in one dict display (existing key order is kept)
+        new_action = {
+            **action,
+            "reasons": localized,                      # Human-readable localized strings
+            "reasons_structured": reasons_structured,  # Original structured format for LLM/chat
+        }
 
-        # Translate priority if present
+        # Translate priority if present (string priorities are a direct value-map lookup)
         priority = action.get("priority")
-        if priority is not None:
+        if isinstance(priority, str):
+            new_action["priority"] = value_map.get(priority, priority)
+        elif priority is not None:
             new_action["priority"] = _normalize_params({"priority": priority}, language).get("priority", priority)
 
         formatted.append(new_action)
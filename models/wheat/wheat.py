@@ -150,7 +150,7 @@ class WheatModel(BaseModel):
     #----------------------------------------------------------------------------------------------------------------------------
     # Pest and disease monitoring rule
     # Alerts for aphid sightings and rust disease risk based on observations and weather
-    def _rule_pest_disease(self, ctx: WheatStruct, recs) -> None:
+    def _rule_pest_disease(self, ctx: WheatStruct, recs, not_recs) -> None:
         if ctx.aphids:
             self._add_rec(recs, "SCOUT_APHIDS", "medium", [reason("aphids_observed")])
 
@@ -169,7 +169,7 @@ class WheatModel(BaseModel):
     #----------------------------------------------------------------------------------------------------------------------------
     # Spray safety rule
     # Warns against midday spraying when wind or heat conditions reduce effectiveness
-    def _rule_spray_safety(self, ctx: WheatStruct, recs) -> None:
+    def _rule_spray_safety(self, ctx: WheatStruct, recs, not_recs) -> None:
         if (ctx.wind >= 6) or (ctx.tmax >= 35):
             self._add_rec(
                 recs,
@@ -185,12 +185,13 @@ class WheatModel(BaseModel):
     #----------------------------------------------------------------------------------------------------------------------------
     # Apply all wheat decision rules
     # Evaluates all rule categories and populates recommendations and not-recommended lists
-    def _apply_rules(self, ctx, recs, not_recs):
+    rule_order = (
         # Check if irrigation is required
-        self._rule_irrigation(ctx, recs, not_recs)
+        "_rule_irrigation",
         # Check if fertilization is needed
-        self._rule_fertilize(ctx, recs, not_recs)
+        "_rule_fertilize",
         # Check for pest and disease risks
-        self._rule_pest_disease(ctx, recs)
+        "_rule_pest_disease",
         # Check spray safety conditions
-        self._rule_spray_safety(ctx, recs)
+        "_rule_spray_safety",
+    )
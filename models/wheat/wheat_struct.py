@@ -12,7 +12,7 @@ from typing import Any, Dict
 #----------------------------------------------------------------------------------------------------------------------------
 # Wheat context structure - Immutable snapshot of all data needed for decision rules
 #----------------------------------------------------------------------------------------------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WheatStruct:
     # Weather inputs
     tmax: float              # Maximum temperature in Celsius
@@ -0,0 +1,14 @@
+#===========================================================================================================================
+# Test configuration
+# Makes the backend and models packages importable when pytest is run from any directory
+#===========================================================================================================================
+
+#----------------------------------------------------------------------------------------------------------------------------
+# IMPORTS
+import sys
+from pathlib import Path
+#----------------------------------------------------------------------------------------------------------------------------
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
@@ -0,0 +1,225 @@
+#===========================================================================================================================
+# API endpoint tests
+# Runs the FastAPI app in-process (lifespan included, so scenarios are preloaded)
+#===========================================================================================================================
+
+#----------------------------------------------------------------------------------------------------------------------------
+# IMPORTS
+import logging
+import os
+import shutil
+from types import MappingProxyType
+
+import orjson
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import app as app_module
+from backend.app import app
+#----------------------------------------------------------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+#----------------------------------------------------------------------------------------------------------------------------
+# POST /v1/recommendations:batch
+#----------------------------------------------------------------------------------------------------------------------------
+def test_batch_matches_single_requests_in_order(client):
+    items = [
+        {"farm_type": "orchard", "scenario_id": 4, "language": "az"},
+        {"farm_type": "wheat", "scenario_id": 1, "language": "az"},
+    ]
+    resp = client.post("/v1/recommendations:batch", json={"items": items})
+    assert resp.status_code == 200
+    singles = [client.post("/v1/recommendations", json=item).json() for item in items]
+    assert resp.json() == {"results": singles}
+
+
+def test_batch_rejects_empty_items(client):
+    resp = client.post("/v1/recommendations:batch", json={"items": []})
+    assert resp.status_code == 422
+
+
+def test_batch_rejects_more_than_1000_items(client):
+    items = [{"farm_type": "wheat", "scenario_id": 1}] * 1001
+    resp = client.post("/v1/recommendations:batch", json={"items": items})
+    assert resp.status_code == 422
+
+
+def test_batch_accepts_1000_items(client):
+    items = [{"farm_type": "wheat", "scenario_id": 1}] * 1000
+    resp = client.post("/v1/recommendations:batch", json={"items": items})
+    assert resp.status_code == 200
+    assert len(resp.json()["results"]) == 1000
+
+
+def test_batch_fails_whole_request_on_mid_batch_error(client):
+    items = [
+        {"farm_type": "wheat", "scenario_id": 1},
+        {"farm_type": "wheat", "scenario_id": 999},
+        {"farm_type": "wheat", "scenario_id": 2},
+    ]
+    resp = client.post("/v1/recommendations:batch", json={"items": items})
+    assert resp.status_code == 404
+    assert "results" not in resp.json()
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Startup preload with broken scenario files
+#----------------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def broken_scenarios_dir(tmp_path, monkeypatch):
+    wheat_dir = tmp_path / "wheat" / "synthetic_scenarios"
+    wheat_dir.mkdir(parents=True)
+    shutil.copy(app_module.scenario_path("wheat", 1), wheat_dir / "scenario_1.json")
+    (wheat_dir / "scenario_2.json").write_text("{not json", encoding="utf-8")
+    (wheat_dir / "scenario_3.json").write_text("[1, 2, 3]", encoding="utf-8")
+    (wheat_dir / "scenario_draft.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(app_module, "FARMS_SCEN_DIR_STR", str(tmp_path) + os.sep)
+    yield tmp_path
+    # Put the real scenario tables back for the other tests
+    monkeypatch.undo()
+    app_module.preload_scenarios()
+
+
+def test_startup_skips_broken_scenario_files(broken_scenarios_dir, caplog):
+    with caplog.at_level(logging.WARNING, logger="backend.app"):
+        with TestClient(app) as test_client:
+            listing = test_client.get("/v1/farms/wheat/scenarios")
+            assert listing.status_code == 200
+            assert [s["id"] for s in listing.json()["scenarios"]] == [1]
+            assert test_client.get("/v1/farms/wheat/scenarios/1").status_code == 200
+            assert test_client.get("/v1/farms/wheat/scenarios/2").status_code == 404
+            assert test_client.get("/v1/farms/orchard/scenarios").json()["scenarios"] == []
+
+    skipped = " ".join(record.getMessage() for record in caplog.records)
+    for name in ("scenario_2.json", "scenario_3.json", "scenario_draft.json"):
+        assert name in skipped
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Recommendation body memoization and invalidation
+#----------------------------------------------------------------------------------------------------------------------------
+def test_recommendation_body_is_memoized(client):
+    app_module.invalidate_model_cache()
+    first = app_module.recommendation_body("wheat", 1, "az")
+    assert app_module.recommendation_body("wheat", 1, "az") is first
+    assert app_module.recommendation_body("wheat", 1, "en") is not first
+
+
+def test_invalidate_all_recomputes(client):
+    first = app_module.recommendation_body("wheat", 1, "az")
+    app_module.invalidate_model_cache()
+    second = app_module.recommendation_body("wheat", 1, "az")
+    assert second is not first and second == first
+
+
+def test_invalidate_one_farm_type(client):
+    wheat = app_module.recommendation_body("wheat", 1, "az")
+    orchard = app_module.recommendation_body("orchard", 1, "az")
+    app_module.invalidate_model_cache("wheat")
+    assert app_module.recommendation_body("wheat", 1, "az") is not wheat
+    assert app_module.recommendation_body("orchard", 1, "az") is orchard
+
+
+def test_body_cached_from_old_tables_is_not_served(client, monkeypatch):
+    generation = app_module._CACHE_GENERATION
+    farm_generation = app_module._FARM_CACHE_GENERATION.get("wheat", 0)
+    original = app_module.SCENARIOS
+
+    # A request still running against the old tables finishes after the swap and invalidation
+    stale_tables = {**original, "wheat": {**original["wheat"], 1: original["wheat"][2]}}
+    monkeypatch.setattr(app_module, "SCENARIOS", stale_tables)
+    app_module.invalidate_model_cache()
+    stale = app_module._cached_recommendation_body("wheat", 1, "az", generation, farm_generation)
+
+    monkeypatch.setattr(app_module, "SCENARIOS", original)
+    fresh = app_module.recommendation_body("wheat", 1, "az")
+    assert fresh != stale
+    assert fresh == client.post("/v1/recommendations", json={"farm_type": "wheat", "scenario_id": 1}).content
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# GET /v1/farms/{farm_type}/scenarios/{scenario_id} - ETag revalidation
+#----------------------------------------------------------------------------------------------------------------------------
+SCENARIO_URL = "/v1/farms/wheat/scenarios/1"
+
+
+@pytest.fixture(scope="module")
+def scenario_etag(client):
+    return client.get(SCENARIO_URL).headers["etag"]
+
+
+def test_scenario_has_etag_and_cache_control(client, scenario_etag):
+    resp = client.get(SCENARIO_URL)
+    assert resp.status_code == 200
+    assert scenario_etag.startswith('"') and scenario_etag.endswith('"')
+    assert resp.headers["cache-control"] == app_module.SCENARIO_CACHE_CONTROL
+    assert resp.json()["scenario_id"] == 1
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"other", {etag}',
+    '"other",W/{etag} , "more"',
+    "*",
+])
+def test_scenario_matching_etag_answers_304(client, scenario_etag, if_none_match):
+    resp = client.get(SCENARIO_URL, headers={"If-None-Match": if_none_match.format(etag=scenario_etag)})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == scenario_etag
+    assert resp.headers["cache-control"] == app_module.SCENARIO_CACHE_CONTROL
+
+
+@pytest.mark.parametrize("if_none_match", ['"other"', '"a", "b"', ""])
+def test_scenario_mismatching_etag_answers_200(client, if_none_match):
+    resp = client.get(SCENARIO_URL, headers={"If-None-Match": if_none_match})
+    assert resp.status_code == 200
+    assert resp.json()["scenario_id"] == 1
+
+
+def test_scenario_etag_differs_per_scenario(client, scenario_etag):
+    other = client.get("/v1/farms/wheat/scenarios/2")
+    assert other.headers["etag"] != scenario_etag
+    resp = client.get("/v1/farms/wheat/scenarios/2", headers={"If-None-Match": scenario_etag})
+    assert resp.status_code == 200
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Preloaded scenarios are frozen and every model runs on them
+#----------------------------------------------------------------------------------------------------------------------------
+def test_freeze_json_is_read_only():
+    frozen = app_module.freeze_json({"a": {"b": [1, {"c": 2}]}})
+    assert isinstance(frozen, MappingProxyType) and frozen["a"]["b"] == (1, MappingProxyType({"c": 2}))
+    with pytest.raises(TypeError):
+        frozen["a"]["x"] = 1
+    with pytest.raises(TypeError):
+        frozen["a"]["b"][1]["c"] = 3
+    with pytest.raises(AttributeError):
+        frozen["a"]["b"].append(3)
+
+
+@pytest.mark.parametrize("farm_type", app_module.FARM_TYPES)
+def test_models_run_on_frozen_scenarios(client, farm_type):
+    model, formatter = app_module.DISPATCH[farm_type]
+    scenarios = app_module.SCENARIOS[farm_type]
+    assert scenarios
+
+    for scenario_id, frozen in scenarios.items():
+        assert isinstance(frozen, MappingProxyType)
+        assert isinstance(frozen["decision_inputs"], MappingProxyType)
+        with pytest.raises(TypeError):
+            frozen["decision_inputs"]["injected"] = True
+        with pytest.raises(TypeError):
+            del frozen["decision_inputs"]
+
+        # Same output as a plain mutable copy read straight from the file
+        with open(app_module.scenario_path(farm_type, scenario_id), "rb") as f:
+            plain = orjson.loads(f.read())
+        assert formatter(model.run(frozen).to_dict(), "az") == formatter(model.run(plain).to_dict(), "az")
+#----------------------------------------------------------------------------------------------------------------------------
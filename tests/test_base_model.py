@@ -0,0 +1,152 @@
+#===========================================================================================================================
+# BaseModel tests
+# Covers the shared struct building, rule dispatch and class definition checks of the Template Method workflow
+#===========================================================================================================================
+
+#----------------------------------------------------------------------------------------------------------------------------
+# IMPORTS
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import pytest
+
+from backend.schema import BaseScenarioData
+from models.base import BaseModel
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Minimal scenario data and structs for the default _build_struct
+#----------------------------------------------------------------------------------------------------------------------------
+@dataclass
+class OneScenarioData(BaseScenarioData):
+    __slots__ = ("level",)
+
+    def __post_init__(self) -> None:
+        self.level: float = self.get_float("tank", "level", default=0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class OneStruct:
+    level: float
+    derived: Dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class DerivedOnlyStruct:
+    derived: Dict[str, Any]
+
+
+class OneModel(BaseModel):
+    scenario_data_class = OneScenarioData
+    struct_class = OneStruct
+    rule_order = ("_rule_level",)
+
+    def _derive(self, di):
+        return {"level_bucket": "low" if di.level < 10 else "ok"}
+
+    def _rule_level(self, ctx, recs, not_recs):
+        if ctx.derived["level_bucket"] == "low":
+            self._add_rec(recs, "REFILL_TANK", "high", [ctx.level])
+
+
+class DerivedOnlyModel(BaseModel):
+    scenario_data_class = OneScenarioData
+    struct_class = DerivedOnlyStruct
+    rule_order = ("_rule_noop",)
+
+    def _derive(self, di):
+        return {"level_bucket": "ok"}
+
+    def _rule_noop(self, ctx, recs, not_recs):
+        pass
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Default _build_struct
+#----------------------------------------------------------------------------------------------------------------------------
+def test_build_struct_with_single_field():
+    out = OneModel().run({"decision_inputs": {"tank": {"level": 4.5}}})
+    assert out.derived == {"level_bucket": "low"}
+    assert out.recommendations == [{"code": "REFILL_TANK", "priority": "high", "reasons": [4.5]}]
+
+
+def test_build_struct_with_derived_only():
+    model = DerivedOnlyModel()
+    di = model._parse_inputs({"decision_inputs": {}})
+    assert model._build_struct(di, {"level_bucket": "ok"}) == DerivedOnlyStruct(derived={"level_bucket": "ok"})
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Class definition checks
+#----------------------------------------------------------------------------------------------------------------------------
+def test_concrete_model_without_struct_is_rejected():
+    with pytest.raises(TypeError, match="struct_class or override _build_struct"):
+        class NoStructModel(BaseModel):
+            rule_order = ("_rule_noop",)
+
+            def _derive(self, di):
+                return {}
+
+            def _rule_noop(self, ctx, recs, not_recs):
+                pass
+
+
+def test_abstract_model_without_struct_is_allowed():
+    class PartialModel(BaseModel):
+        pass
+
+    class CustomStructModel(PartialModel):
+        rule_order = ("_rule_noop",)
+
+        def _derive(self, di):
+            return {}
+
+        def _build_struct(self, di, derived):
+            return derived
+
+        def _rule_noop(self, ctx, recs, not_recs):
+            pass
+
+    assert CustomStructModel().run({"decision_inputs": {}}).derived == {}
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# rule_order checks
+#----------------------------------------------------------------------------------------------------------------------------
+def test_concrete_model_without_rules_is_rejected():
+    with pytest.raises(TypeError, match="rule_order or override _apply_rules"):
+        class NoRulesModel(BaseModel):
+            struct_class = OneStruct
+
+            def _derive(self, di):
+                return {}
+
+
+@pytest.mark.parametrize("name", ["_rule_missing", "_derive", "run"])
+def test_rule_order_entry_must_be_rule_method(name):
+    with pytest.raises(TypeError, match="is not a _rule_\\* method"):
+        class BadRulesModel(BaseModel):
+            struct_class = OneStruct
+            rule_order = (name,)
+
+            def _derive(self, di):
+                return {}
+
+
+def test_rules_run_in_rule_order():
+    class OrderedModel(BaseModel):
+        struct_class = DerivedOnlyStruct
+        rule_order = ("_rule_second", "_rule_first")
+
+        def _derive(self, di):
+            return {}
+
+        def _rule_first(self, ctx, recs, not_recs):
+            self._add_rec(recs, "FIRST", "low", [])
+
+        def _rule_second(self, ctx, recs, not_recs):
+            self._add_rec(recs, "SECOND", "low", [])
+
+    out = OrderedModel().run({"decision_inputs": {}})
+    assert [r["code"] for r in out.recommendations] == ["SECOND", "FIRST"]
+#----------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,51 @@
+#===========================================================================================================================
+# Livestock model tests
+# Covers the water buckets derived from water supply per animal (80 L per animal per day)
+#===========================================================================================================================
+
+#----------------------------------------------------------------------------------------------------------------------------
+# IMPORTS
+import pytest
+
+from models.registry import get_model
+#----------------------------------------------------------------------------------------------------------------------------
+
+def run_livestock(animal_count, water_liters):
+    decision_inputs = {"livestock": {"animal_count": animal_count}, "resources": {"water_liters": water_liters}}
+    return get_model("livestock").run({"decision_inputs": decision_inputs})
+
+
+def water_recs(out):
+    return [r["code"] for r in out.recommendations if r["code"].startswith("REFILL_WATER")]
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Thresholds for 10 animals: critical below 400 L (0.5x of 800 L), low below 800 L (1x), adequate from 800 L
+#----------------------------------------------------------------------------------------------------------------------------
+@pytest.mark.parametrize("water_liters, status, codes", [
+    (0, "critical", ["REFILL_WATER_URGENT"]),
+    (399.9, "critical", ["REFILL_WATER_URGENT"]),
+    (400, "low", ["REFILL_WATER_TODAY"]),
+    (799.9, "low", ["REFILL_WATER_TODAY"]),
+    (800, "adequate", []),
+    (2000, "adequate", []),
+])
+def test_water_status_thresholds(water_liters, status, codes):
+    out = run_livestock(10, water_liters)
+    assert out.derived["water_status"] == status
+    assert out.derived["water_per_animal"] == round(water_liters / 10, 1)
+    assert water_recs(out) == codes
+
+
+def test_water_per_animal_is_rounded_and_used_in_reason():
+    out = run_livestock(3, 100)
+    assert out.derived["water_per_animal"] == 33.3
+    urgent = next(r for r in out.recommendations if r["code"] == "REFILL_WATER_URGENT")
+    assert urgent["reasons"][0] == {"key": "water_critical", "params": {"per_animal": 33.3}}
+
+
+def test_no_animals_needs_no_water():
+    out = run_livestock(0, 0)
+    assert out.derived["water_status"] == "adequate"
+    assert out.derived["water_per_animal"] == 0
+    assert water_recs(out) == []
+#----------------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,45 @@
+#===========================================================================================================================
+# Rules catalog tests
+# Covers reason formatting and template lookup
+#===========================================================================================================================
+
+#----------------------------------------------------------------------------------------------------------------------------
+# IMPORTS
+from collections import OrderedDict
+from types import MappingProxyType
+
+from models.rules_catalog import format_reason, reason
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# format_reason input types
+#----------------------------------------------------------------------------------------------------------------------------
+class TaggedReason(str):
+    pass
+
+
+def test_format_reason_plain_dict():
+    assert format_reason(reason("dry_conditions", rain24=0, humidity=30)) == format_reason({"key": "dry_conditions", "params": {"rain24": 0, "humidity": 30}})
+
+
+def test_format_reason_dict_subclass_is_formatted():
+    plain = format_reason(reason("dry_conditions", rain24=0, humidity=30))
+    ordered = OrderedDict(key="dry_conditions", params=OrderedDict(rain24=0, humidity=30))
+    assert format_reason(ordered) == plain
+    assert "30" in plain and plain != "dry_conditions"
+
+
+def test_format_reason_read_only_params():
+    params = MappingProxyType({"rain24": 0, "humidity": 30})
+    assert format_reason({"key": "dry_conditions", "params": params}) == format_reason(reason("dry_conditions", rain24=0, humidity=30))
+
+
+def test_format_reason_str_and_subclass_pass_through():
+    tagged = TaggedReason("already formatted")
+    assert format_reason("already formatted") == "already formatted"
+    assert format_reason(tagged) is tagged
+
+
+def test_format_reason_other_types_use_str():
+    assert format_reason(42) == "42"
+#----------------------------------------------------------------------------------------------------------------------------
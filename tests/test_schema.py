@@ -0,0 +1,51 @@
+#===========================================================================================================================
+# Scenario data schema tests
+# Covers typed accessors and the error raised for malformed decision inputs
+#===========================================================================================================================
+
+#----------------------------------------------------------------------------------------------------------------------------
+# IMPORTS
+import pytest
+from fastapi import HTTPException
+
+from backend.app import run_model
+from backend.schema import WheatScenarioData
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Typed accessors
+#----------------------------------------------------------------------------------------------------------------------------
+def test_typed_accessors_coerce_and_default():
+    di = WheatScenarioData({"weather": {"t_max_c": 31, "rain_mm_24h": "2.5"}, "crop": {"stage_code": "tillering"}})
+    assert di.tmax == 31.0 and type(di.tmax) is float
+    assert di.rain24 == 2.5
+    assert di.wind == 0.0
+    assert di.stage == "tillering"
+    assert di.water_available is True
+
+
+@pytest.mark.parametrize("value", [{"c": 30}, [30], "hot"])
+def test_unconvertible_value_is_value_error(value):
+    with pytest.raises(ValueError, match="t_max_c|hot"):
+        WheatScenarioData({"weather": {"t_max_c": value}})
+#----------------------------------------------------------------------------------------------------------------------------
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Error precedence - all fields are read up front in __post_init__ order
+# The first malformed field in that order is reported, whichever field the rules would have read first
+#----------------------------------------------------------------------------------------------------------------------------
+def test_first_malformed_field_in_read_order_is_reported():
+    with pytest.raises(ValueError, match="'hot'"):
+        WheatScenarioData({"weather": {"t_max_c": "hot"}, "soil": {"soil_moisture_pct": [1]}})
+
+
+@pytest.mark.parametrize("decision_inputs", [
+    {"weather": {"t_max_c": "hot"}, "soil": {"soil_moisture_pct": "wet"}},
+    {"weather": {"t_max_c": {"c": 30}}, "soil": {"soil_moisture_pct": "wet"}},
+    {"weather": {"humidity_pct": [90]}, "crop": {"stage_code": "tillering"}},
+])
+def test_malformed_inputs_answer_400(decision_inputs):
+    with pytest.raises(HTTPException) as exc_info:
+        run_model("wheat", {"decision_inputs": decision_inputs})
+    assert exc_info.value.status_code == 400
+#----------------------------------------------------------------------------------------------------------------------------